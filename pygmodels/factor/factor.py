@@ -4,13 +4,22 @@
 Defining a factor from Koller and Friedman 2009, p. 106-107
 """
 
+from array import array
 from functools import reduce as freduce
 from itertools import combinations, product
-from pprint import pprint
-from typing import Callable, FrozenSet, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
-from pygmodels.factor.factorf.factorops import FactorBoolOps, FactorOps
+from pygmodels.factor.factorf.factorops import FactorBoolOps
 from pygmodels.factor.ftype.abstractfactor import (
     AbstractFactor,
     DomainSliceSet,
@@ -30,6 +39,8 @@ class Factor(BaseFactor):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         gid: str,
@@ -37,7 +48,7 @@ class Factor(BaseFactor):
         factor_fn: Optional[
             Callable[[Set[Tuple[str, NumCatRVariable]]], float]
         ] = None,
-        data={},
+        data: Optional[Dict] = None,
     ):
         """!
         \brief Constructor for a factor \f$ \phi(A,B) \f$
@@ -104,9 +115,6 @@ class Factor(BaseFactor):
             gid=gid, scope_vars=scope_vars, factor_fn=factor_fn, data=data
         )
 
-        ## scope variable hash table
-        self.domain_table = {s.id(): s for s in self.scope_vars()}
-
     @classmethod
     def from_abstract_factor(cls, f: AbstractFactor):
         """"""
@@ -190,14 +198,57 @@ class Factor(BaseFactor):
         for sv in scope_product:
             var_id = sv[0]
             var_value = sv[1]
-            hasv, var = FactorOps.find_var(self, var_id)
-            if hasv is False:
+            var = self.find_scope_var(var_id)
+            if var is None:
                 raise ValueError(
                     "Unknown variable id among arguments: " + var_id
                 )
             p *= var.marginal(var_value)
         return p
 
+    @property
+    def value_table(self) -> array:
+        """!
+        \brief factor values of the rows of value_matrix
+
+        The marginal joint of a row is the product of the marginals of its
+        values. Marginals are evaluated in one batch per scope variable and
+        the rows are multiplied out column by column in the order of
+        value_matrix, so the factor function is not called on every row.
+
+        \see BaseFactor.value_table
+        """
+        if self.factor_fn != self.marginal_joint:
+            return super().value_table
+        self._check_domain_cache()
+        if self._value_table is None:
+            rows = [1.0]
+            for s, d in zip(self._ordered_svars, self._domain_tuple):
+                ps = s.p_many([v for _, v in d])
+                rows = [r * p for r in rows for p in ps]
+            self._value_table = array("d", rows)
+        return self._value_table
+
+    @property
+    def Z(self) -> float:
+        """!
+        \brief partition value of this factor over its own domain
+
+        When the factor function is the marginal joint, the sum over the
+        cartesian product factorizes into a product of sums:
+        \f[ \sum_{x_1, \dots, x_k} \prod_{i=1}^k p(x_i) = \prod_{i=1}^k
+        \sum_{x_i} p(x_i) \f]
+        so we avoid evaluating every row of the domain.
+
+        \see BaseFactor.Z
+        """
+        if self.factor_fn != self.marginal_joint:
+            return super().Z
+        z = 1.0
+        for s in self.scope_vars():
+            z *= sum(s.p_many(s.values()))
+        return z
+
     def __contains__(self, v: Union[NumCatRVariable, str]) -> bool:
         """!
         \brief Check if given parameter is in scope of this factor
@@ -212,8 +263,8 @@ class Factor(BaseFactor):
         not.
         """
         if isinstance(v, NumCatRVariable):
-            return v.id() in self.domain_table
+            return v.id() in self._id_to_index
         elif isinstance(v, str):
-            return v in self.domain_table
+            return v in self._id_to_index
         else:
             raise TypeError("argument must be NumCatRVariable or its id")
@@ -2,10 +2,12 @@
 \file factoralg.py Factor algebra operations
 """
 
+import weakref
+from collections import OrderedDict
 from functools import reduce as freduce
 from itertools import combinations
+from operator import mul
 from typing import Callable, FrozenSet, List, Optional, Set, Tuple, Union
-from uuid import uuid4
 
 from pygmodels.factor.factorf.factorops import FactorFactorableOps, FactorOps
 from pygmodels.factor.ftype.abstractfactor import (
@@ -15,9 +17,60 @@ from pygmodels.factor.ftype.abstractfactor import (
     FactorDomain,
     FactorScope,
 )
-from pygmodels.factor.ftype.basefactor import BaseFactor
+from pygmodels.factor.ftype.basefactor import BaseFactor, new_gid
 from pygmodels.randvar.rtype.abstractrandvar import AbstractRandomVariable
 
+## maximum number of memoized factor algebra results per factor
+CACHE_SIZE = 64
+
+## factors holding memoized results, \see FactorAlgebra.clear_cache
+_cached_factors: weakref.WeakSet = weakref.WeakSet()
+
+
+def _domain_key(f: AbstractFactor) -> tuple:
+    """!
+    \brief outcome values of the scope variables of a factor
+    """
+    return tuple(s.values() for s in f.scope_vars())
+
+
+def _memoized(key: str, f: AbstractFactor, other, compute: Callable):
+    """!
+    \brief memoize the result of a factor algebra operation
+
+    Results are stored on their first operand f, so they are released
+    together with it. The second operand is only referenced weakly, which
+    also guards against a recycled identity being mistaken for a cached
+    operand. The outcome values of the factors are kept as well, since
+    scope variables can be reduced after the computation.
+    """
+    if not isinstance(f, BaseFactor):
+        return compute()
+    domains = tuple(
+        _domain_key(o) for o in (f, other) if isinstance(o, AbstractFactor)
+    )
+    cache = f._algebra_cache
+    if cache is None:
+        cache = OrderedDict()
+        f._algebra_cache = cache
+        _cached_factors.add(f)
+    ckey = (key, id(other))
+    hit = cache.get(ckey)
+    if hit is not None:
+        c_other, c_domains, result = hit
+        if c_other() is other and c_domains == domains:
+            cache.move_to_end(ckey)
+            return result
+    result = compute()
+    try:
+        other_ref = weakref.ref(other)
+    except TypeError:
+        return result
+    cache[ckey] = (other_ref, domains, result)
+    if len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+    return result
+
 
 class FactorAlgebra:
     """
@@ -29,20 +82,46 @@ class FactorAlgebra:
     def product(
         f: AbstractFactor,
         other: AbstractFactor,
-        product_fn=lambda x, y: x * y,
-        accumulator=lambda added, accumulated: added * accumulated,
+        product_fn=mul,
+        accumulator=mul,
     ) -> Tuple[AbstractFactor, float]:
         """!
         Wrapper of FactorOps.cls_product
+
+        Results are memoized when the default product and accumulator
+        functions are used, \see FactorAlgebra.clear_cache()
         """
-        ((scope, phi), prod) = FactorOps.product(
-            f=f,
-            other=other,
-            product_fn=product_fn,
-            accumulator=accumulator,
+
+        def compute():
+            ((scope, phi), prod) = FactorOps.product(
+                f=f,
+                other=other,
+                product_fn=product_fn,
+                accumulator=accumulator,
+            )
+            return (
+                BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi),
+                prod,
+            )
+
+        if product_fn is not mul or accumulator is not mul:
+            return compute()
+        return _memoized("product", f, other, compute)
+
+    @staticmethod
+    def products(
+        fs: List[AbstractFactor],
+        product_fn=mul,
+        accumulator=mul,
+    ) -> Tuple[AbstractFactor, float]:
+        """!
+        Wrapper of FactorOps.products
+        """
+        ((scope, phi), prod) = FactorOps.products(
+            fs=fs, product_fn=product_fn, accumulator=accumulator
         )
         return (
-            BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi),
+            BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi),
             prod,
         )
 
@@ -54,7 +133,7 @@ class FactorAlgebra:
         Wrapper of FactorOps.cls_reduced
         """
         (scope, phi) = FactorOps.reduced(f=f, assignments=assignments)
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+        return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
 
     @staticmethod
     def reduced_by_value(
@@ -66,7 +145,7 @@ class FactorAlgebra:
         (scope, phi) = FactorFactorableOps.reduced_by_value(
             f=f, assignments=assignments
         )
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+        return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
 
     @staticmethod
     def filter_assignments(
@@ -78,7 +157,7 @@ class FactorAlgebra:
         (scope, phi) = FactorOps.filter_assignments(
             f=f, assignments=assignments
         )
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+        return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
 
     @staticmethod
     def reduced_by_vars(
@@ -90,7 +169,7 @@ class FactorAlgebra:
         (scope, phi) = FactorFactorableOps.reduced_by_vars(
             f=f, assignments=assignments
         )
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+        return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
 
     @staticmethod
     def maxout_var(
@@ -98,9 +177,15 @@ class FactorAlgebra:
     ) -> AbstractFactor:
         """!
         Wrapper of FactorOps.maxout_var
+
+        Results are memoized, \see FactorAlgebra.clear_cache()
         """
-        (scope, phi) = FactorFactorableOps.maxout_var(f=f, Y=Y)
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+
+        def compute():
+            (scope, phi) = FactorFactorableOps.maxout_var(f=f, Y=Y)
+            return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
+
+        return _memoized("maxout_var", f, Y, compute)
 
     @staticmethod
     def sumout_var(
@@ -108,9 +193,15 @@ class FactorAlgebra:
     ) -> AbstractFactor:
         """!
         Wrapper of FactorOps.cls_sumout_var
+
+        Results are memoized, \see FactorAlgebra.clear_cache()
         """
-        (scope, phi) = FactorFactorableOps.sumout_var(f=f, Y=Y)
-        return BaseFactor(gid=str(uuid4()), scope_vars=scope, factor_fn=phi)
+
+        def compute():
+            (scope, phi) = FactorFactorableOps.sumout_var(f=f, Y=Y)
+            return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
+
+        return _memoized("sumout_var", f, Y, compute)
 
     @staticmethod
     def sumout_vars(
@@ -119,17 +210,30 @@ class FactorAlgebra:
         """!
         \brief Sum the variable out of factor as per Koller, Friedman 2009, p. 297
 
-        \see Factor.sumout_var(Y)
+        All variables are summed out in one pass over the domain of f, so no
+        intermediate factor is built per eliminated variable. A single
+        variable goes through the memoized sumout_var.
+
+        \see FactorFactorableOps.sumout_vars(f, Ys)
 
         \return Factor
         """
         if len(Ys) == 0:
             raise ValueError("variables not be an empty set")
         if len(Ys) == 1:
-            v = Ys.pop()
-            return FactorAlgebra.sumout_var(f, v)
-        ylst = list(Ys)
-        fac = FactorAlgebra.sumout_var(f, ylst[0])
-        for i in range(1, len(ylst)):
-            fac = FactorAlgebra.sumout_var(fac, ylst[i])
-        return fac
+            return FactorAlgebra.sumout_var(f, next(iter(Ys)))
+        (scope, phi) = FactorFactorableOps.sumout_vars(f=f, Ys=Ys)
+        return BaseFactor(gid=new_gid(), scope_vars=scope, factor_fn=phi)
+
+    @staticmethod
+    def clear_cache():
+        """!
+        \brief drop memoized results of product, maxout_var and sumout_var
+
+        Reductions are not memoized since they reduce the scope variables of
+        the factor in place. Results are released with their first operand,
+        so calling this is not needed to reclaim memory.
+        """
+        for f in list(_cached_factors):
+            f._algebra_cache = None
+        _cached_factors.clear()
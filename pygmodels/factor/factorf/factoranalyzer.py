@@ -77,9 +77,7 @@ class FactorNumericAnalyzer:
 
         \return normalized preference value
         """
-        fdomain = FactorOps.factor_domain(f)
-        Z = FactorOps.partition_value(fdomain)
-        return phi_result / Z
+        return phi_result / FactorNumericAnalyzer.zval(f)
 
     @staticmethod
     def min_probability(f: AbstractFactor) -> ProbabilityValue:
@@ -133,7 +131,7 @@ class FactorNumericAnalyzer:
 
         \see Factor.partition_value(domains)
         """
-        return sum([f.phi(scope_product=sv) for sv in FactorOps.cartesian(f)])
+        return f.partition_value(FactorOps.factor_domain(f, D=f.scope_vars()))
 
 
 class FactorAnalyzer:
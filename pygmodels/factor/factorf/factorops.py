@@ -7,7 +7,17 @@ or a set of factors.
 
 from functools import reduce as freduce
 from itertools import combinations, product
-from typing import Callable, FrozenSet, List, Optional, Set, Tuple, Union
+from operator import add, mul
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
 from pygmodels.factor.ftype.abstractfactor import (
@@ -62,12 +72,11 @@ class FactorFactorableOps:
            a2  |  b1  |  c1
 
         """
+        values = dict(assignments)
         svars = set()
         for sv in f.scope_vars():
-            for kval in assignments:
-                k, value = kval
-                if sv.id() == k:
-                    sv.reduce_to_value(value)
+            if sv.id() in values:
+                sv.reduce_to_value(values[sv.id()])
             svars.add(sv)
         return tuple([svars, f.phi])
 
@@ -124,15 +133,16 @@ class FactorFactorableOps:
         if Y not in f.scope_vars():
             raise ValueError("argument is not in scope of this factor")
 
-        # Y_vals = Y.value_set()
         products = FactorOps.cartesian(f)
         fn = f.phi
+        table = FactorFactorableOps.tabulate_out(f, set([Y]), max)
 
         def psi(scope_product: DomainSliceSet):
             """"""
-            s = set(scope_product)
-            diffs = set([p for p in products if s.issubset(p) is True])
-            return max([fn(d) for d in diffs])
+            s = frozenset(scope_product)
+            if s in table:
+                return table[s]
+            return max(fn(p) for p in products if s.issubset(p))
 
         return tuple([frozenset(f.scope_vars().difference({Y})), psi])
 
@@ -169,18 +179,85 @@ class FactorFactorableOps:
             msg += " ".join(f.scope_vars())
             raise ValueError(msg)
 
-        # Y_vals = Y.value_set()
         products = FactorOps.cartesian(f)
         fn = f.phi
+        table = FactorFactorableOps.tabulate_out(f, set([Y]), add)
 
         def psi(scope_product: DomainSliceSet):
             """"""
-            s = set(scope_product)
-            diffs = set([p for p in products if s.issubset(p) is True])
-            return sum([fn(d) for d in diffs])
+            s = frozenset(scope_product)
+            if s in table:
+                return table[s]
+            return sum(fn(p) for p in products if s.issubset(p))
 
         return tuple([frozenset(f.scope_vars().difference({Y})), psi])
 
+    @staticmethod
+    def tabulate_out(
+        f: AbstractFactor, Ys: Set[AbstractRandomVariable], accumulate: Callable
+    ) -> Dict[FrozenSet[Tuple[str, NumericValue]], float]:
+        """!
+        \brief Evaluate the factor once over its domain, accumulating Ys out
+
+        Each row of the factor domain is evaluated a single time and folded
+        with the accumulator into a table whose keys are the assignments to
+        the variables that are not in Ys. Factors produced by summing or
+        maxing out variables look their values up in this table instead of
+        scanning the whole domain of the original factor on each call.
+
+        \param Ys variables that are accumulated out
+        \param accumulate binary function combining two factor values, for
+        example operator.add or max
+
+        \return table from remaining assignments to accumulated values
+        """
+        y_ids = set([Y.id() for Y in Ys])
+        fn = f.phi
+        table = {}
+        for p in FactorOps.cartesian(f):
+            key = frozenset([kv for kv in p if kv[0] not in y_ids])
+            val = fn(p)
+            table[key] = accumulate(table[key], val) if key in table else val
+        return table
+
+    @staticmethod
+    def sumout_vars(
+        f: AbstractFactor, Ys: Set[AbstractRandomVariable]
+    ) -> Tuple[FactorScope, Callable]:
+        """!
+        \brief Sum a set of variables out of factor in a single pass
+
+        Computes \f$ \psi(X) = \sum_{Y_1, \dots, Y_n} \phi(X, Y_1, \dots,
+        Y_n) \f$ as per Koller, Friedman 2009, p. 297. Instead of summing out
+        variables one after the other, each row of the factor domain is
+        evaluated once and accumulated into a table whose keys are the
+        assignments to the remaining variables.
+
+        \param Ys variables that we are going to sum out.
+
+        \throw ValueError We raise a value error if any of the arguments is
+        not in the scope of this factor
+
+        \see FactorFactorableOps.sumout_var(f, Y)
+        """
+        svars = f.scope_vars()
+        for Y in Ys:
+            if Y not in svars:
+                msg = "Argument " + str(Y)
+                msg += " is not in scope of this factor"
+                raise ValueError(msg)
+
+        table = FactorFactorableOps.tabulate_out(f, Ys, add)
+
+        def psi(scope_product: DomainSliceSet):
+            """"""
+            s = frozenset(scope_product)
+            if s in table:
+                return table[s]
+            return sum(v for k, v in table.items() if s.issubset(k))
+
+        return tuple([frozenset(svars.difference(Ys)), psi])
+
 
 class FactorBoolOps:
     """!
@@ -245,8 +322,8 @@ class FactorOps:
     def product(
         f: AbstractFactor,
         other: AbstractFactor,
-        product_fn=lambda x, y: x * y,
-        accumulator=lambda added, accumulated: added * accumulated,
+        product_fn=mul,
+        accumulator=mul,
     ) -> Tuple[Tuple[FactorScope, Callable], float]:
         """!
         \brief Factor product operation from Koller, Friedman 2009, p. 107
@@ -279,37 +356,89 @@ class FactorOps:
         #
         svar = f.scope_vars()
         ovar = other.scope_vars()
-        var_inter = svar.intersection(ovar)
-        var_inter = list(var_inter)
-        vsets = [v.value_set() for v in var_inter]
-        inter_products = list(product(*vsets))
+        inter_ids = set([v.id() for v in svar.intersection(ovar)])
         smatch = FactorOps.cartesian(f)
         omatch = FactorOps.cartesian(other)
+        # join rows of both factors on their assignment to common variables
+        oindex = {}
+        for o in omatch:
+            key = frozenset([kv for kv in o if kv[0] in inter_ids])
+            oindex.setdefault(key, []).append(o)
+        ovals = {}
         prod = 1.0
-        common_match = set()
-        for iproduct in inter_products:
-            for o in omatch:
-                for s in smatch:
-                    ss = set(s)
-                    ost = set(o)
-                    prod_s = set(iproduct)
-                    if prod_s.issubset(ss) and prod_s.issubset(ost):
-                        common = ss.union(ost)
-                        multi = product_fn(
-                            f.factor_fn(ss), other.factor_fn(ost)
-                        )
-                        common_match.add((multi, tuple(common)))
-                        prod = accumulator(multi, prod)
+        common_match = {}
+        for s in smatch:
+            key = frozenset([kv for kv in s if kv[0] in inter_ids])
+            if key not in oindex:
+                continue
+            s_val = f.factor_fn(set(s))
+            for o in oindex[key]:
+                if o not in ovals:
+                    ovals[o] = other.factor_fn(set(o))
+                multi = product_fn(s_val, ovals[o])
+                common_match[s.union(o)] = multi
+                prod = accumulator(multi, prod)
 
         def fx(scope_product: Set[Tuple[str, NumericValue]]):
             """"""
-            for multip, match in common_match:
-                if set(match) == set(scope_product):
-                    return multip
+            return common_match.get(frozenset(scope_product))
 
         f = tuple([frozenset(svar.union(ovar)), fx])
         return f, prod
 
+    @staticmethod
+    def products(
+        fs: List[AbstractFactor],
+        product_fn=mul,
+        accumulator=mul,
+    ) -> Tuple[Tuple[FactorScope, Callable], float]:
+        """!
+        \brief Product of several factors in a single pass over their joint
+        domain, \f$ \prod_i \phi_i(X_i) \f$
+
+        Folding FactorOps.product over the factors builds a table for every
+        intermediate product. Here each row of the joint domain is evaluated
+        directly from the factors, so no intermediate table is built. Factor
+        values are looked up once per row of each factor's own domain.
+
+        \param fs factors in the order in which their values are multiplied
+        \param product_fn \see FactorOps.product
+        \param accumulator \see FactorOps.product
+
+        \return tuple whose first element is the resulting factor and second
+        element is the accumulated product.
+        """
+        if len(fs) == 0:
+            raise ValueError("Must have a non empty list of factors")
+        for f in fs:
+            if not isinstance(f, AbstractFactor):
+                raise TypeError("fs argument needs to contain factors")
+        scope = frozenset().union(*[f.scope_vars() for f in fs])
+        ordered = sorted(scope, key=lambda s: s.id())
+        position = {s.id(): i for i, s in enumerate(ordered)}
+        specs = [
+            (f, tuple([position[s.id()] for s in f.scope_vars()]), {})
+            for f in fs
+        ]
+        table = {}
+        prod = 1.0
+        for row in product(*[s.value_set() for s in ordered]):
+            val = None
+            for f, positions, fvals in specs:
+                key = frozenset([row[i] for i in positions])
+                if key not in fvals:
+                    fvals[key] = f.factor_fn(set(key))
+                fval = fvals[key]
+                val = fval if val is None else product_fn(val, fval)
+            table[frozenset(row)] = val
+            prod = accumulator(val, prod)
+
+        def fx(scope_product: Set[Tuple[str, NumericValue]]):
+            """"""
+            return table.get(frozenset(scope_product))
+
+        return tuple([scope, fx]), prod
+
     @staticmethod
     def filter_assignments(
         f: AbstractFactor,
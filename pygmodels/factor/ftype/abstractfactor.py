@@ -20,6 +20,8 @@ FactorCartesianProduct = FactorDomain
 class AbstractFactor(AbstractGraphObj):
     """"""
 
+    __slots__ = ()
+
     @abstractmethod
     def scope_vars(self, filter_fn: Callable[[FactorScope], Set[FactorScope]]):
         """"""
@@ -2,10 +2,11 @@
 \file basefactor.py Basic factor that implements an AbstractFactor
 """
 
+from array import array
 from functools import reduce as freduce
-from itertools import combinations, product
-from typing import Callable, Optional, Set
-from uuid import uuid4
+from itertools import combinations, count, product
+from operator import eq
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from pygmodels.factor.ftype.abstractfactor import (
     AbstractFactor,
@@ -18,31 +19,89 @@ from pygmodels.graph.gtype.graphobj import GraphObject
 from pygmodels.randvar.rtype.abstractrandvar import AbstractRandomVariable
 from pygmodels.value.value import NumericValue
 
+_factor_counter = count()
+
+
+def new_gid() -> str:
+    """!
+    \brief generate a factor identifier that is unique within the process
+
+    Cheaper than uuid4 for the many intermediate factors produced during
+    inference.
+    """
+    return "factor-" + str(next(_factor_counter))
+
 
 class BaseFactor(AbstractFactor, GraphObject):
     """"""
 
+    ## many intermediate factors are created during inference, so
+    ## instances do not carry a __dict__
+    __slots__ = (
+        "svars",
+        "factor_fn",
+        "_ordered_svars",
+        "_var_names",
+        "_id_to_index",
+        "_scope_products",
+        "_Z",
+        "_domain_key",
+        "_domain_tuple",
+        "_vars_domain",
+        "_value_matrix",
+        "_value_table",
+        "_fingerprint",
+        "_algebra_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         gid: str,
         scope_vars: FactorScope,
         factor_fn: Optional[Callable[[DomainSliceSet], NumericValue]] = None,
-        data={},
+        data: Optional[Dict] = None,
     ):
         """"""
+        if data is None:
+            data = {}
         super().__init__(oid=gid, odata=data)
         for svar in scope_vars:
-            vs = svar.values()
-            if any([v < 0 for v in vs]):
+            if svar.has_negative_value():
                 msg = "Scope variables contain a negative value."
                 msg += " Negative factors are not allowed"
                 raise ValueError(msg)
 
-        ## random variables belonging to this factor
-        self.svars = scope_vars
+        ## random variables belonging to this factor, frozen so that the
+        ## scope can be shared with callers without being copied
+        self.svars = frozenset(scope_vars)
 
         self.factor_fn = factor_fn
 
+        ## scope variables in a fixed order, sorted by their identifiers
+        self._ordered_svars = tuple(sorted(self.svars, key=lambda s: s.id()))
+        ## identifiers of scope variables, column labels of value_matrix
+        self._var_names = tuple(s.id() for s in self._ordered_svars)
+        ## position of scope variables in _ordered_svars by identifier
+        self._id_to_index = {sid: i for i, sid in enumerate(self._var_names)}
+        ## cartesian product of the factor domain, computed on first access
+        self._scope_products = None
+        ## partition value of the factor, computed on first access
+        self._Z = None
+        ## outcome values of scope variables used for cached computations
+        self._domain_key = None
+        self._domain_tuple = None
+        self._vars_domain = None
+        ## domain rows without variable identifiers, computed on first access
+        self._value_matrix = None
+        ## factor values of value_matrix rows, computed on first access
+        self._value_table = None
+        ## hash of domain and codomain values, computed on first access
+        self._fingerprint = None
+        ## memoized factor algebra results having this factor as their first
+        ## operand, \see FactorAlgebra.clear_cache
+        self._algebra_cache = None
+
     def __str__(self):
         """"""
         msg = "Factor: " + self.id() + "\n"
@@ -64,41 +123,26 @@ class BaseFactor(AbstractFactor, GraphObject):
 
         \todo Adapt to continuous factors as well.
         """
+        if n is self:
+            return True
         if not isinstance(n, AbstractFactor):
             return False
-        #
-        def rvar_filter(x: AbstractRandomVariable) -> bool:
-            return True
-
-        def value_filter(x: NumericValue) -> bool:
-            return True
-
-        def value_transform(x: NumericValue) -> NumericValue:
-            return x
-
-        other_domain = [
-            s.value_set(
-                value_filter=value_filter, value_transform=value_transform
-            )
-            for s in n.scope_vars()
-            if rvar_filter(s)
-        ]
-        this_domain = [
-            s.value_set(
-                value_filter=value_filter, value_transform=value_transform
-            )
-            for s in self.scope_vars()
-            if rvar_filter(s)
-        ]
-        if other_domain != this_domain:
+        if len(self.scope_vars()) != len(n.scope_vars()):
             return False
-        #
-        for dval in product(*other_domain):
-            other_phi = n.phi(dval)
-            this_phi = self.phi(dval)
-            if this_phi != other_phi:
+        if isinstance(n, BaseFactor):
+            if self.fingerprint != n.fingerprint:
                 return False
-        return True
+            other_domain = n.vars_domain()
+        else:
+            other_domain = [
+                s.value_set()
+                for s in sorted(n.scope_vars(), key=lambda s: s.id())
+            ]
+        if other_domain != self.vars_domain():
+            return False
+        other_phis = map(n.phi, self.scope_products)
+        this_phis = map(self.phi, self.scope_products)
+        return all(map(eq, this_phis, other_phis))
 
     def is_same(self, n: AbstractFactor):
         """!
@@ -127,6 +171,140 @@ class BaseFactor(AbstractFactor, GraphObject):
         """
         return f(self.svars)
 
+    def find_scope_var(self, sid: str) -> Optional[AbstractRandomVariable]:
+        """!
+        \brief obtain the scope variable with the given identifier
+
+        \return the random variable or None if it is not in scope
+        """
+        i = self._id_to_index.get(sid)
+        if i is None:
+            return None
+        return self._ordered_svars[i]
+
+    def vars_domain(self) -> FactorDomain:
+        """!
+        \brief obtain the domain of each variable in the scope of this factor
+
+        \return list of value sets of scope variables ordered by their
+        identifiers
+        """
+        self._check_domain_cache()
+        return list(self._vars_domain)
+
+    def _check_domain_cache(self):
+        """!
+        \brief invalidate cached domain computations
+
+        Scope variables can be reduced after the construction of the factor,
+        \see NumCatRVariable.reduce_to_value, so we compare their outcome
+        values with those used for the cached computations.
+        """
+        key = tuple(s.values() for s in self._ordered_svars)
+        if key != self._domain_key:
+            self._domain_key = key
+            self._vars_domain = tuple(
+                s.value_set() for s in self._ordered_svars
+            )
+            self._domain_tuple = tuple(tuple(d) for d in self._vars_domain)
+            self._scope_products = None
+            self._value_matrix = None
+            self._value_table = None
+            self._fingerprint = None
+            self._Z = None
+
+    @property
+    def scope_products(self) -> tuple:
+        """!
+        \brief cartesian product of the domain of this factor
+
+        The product is computed once when it is first accessed.
+        """
+        self._check_domain_cache()
+        if self._scope_products is None:
+            self._scope_products = tuple(product(*self._domain_tuple))
+        return self._scope_products
+
+    @property
+    def var_names(self) -> Tuple[str, ...]:
+        """!
+        \brief identifiers of scope variables in the column order of
+        value_matrix
+        """
+        return self._var_names
+
+    @property
+    def value_matrix(self) -> Tuple[Tuple[NumericValue, ...], ...]:
+        """!
+        \brief rows of the factor domain as plain value tuples
+
+        Each row holds the values of scope variables in the order of
+        var_names, so that identifiers are not repeated on every row. The
+        i-th row corresponds to the i-th member of scope_products.
+        """
+        self._check_domain_cache()
+        if self._value_matrix is None:
+            columns = [tuple(v for _, v in d) for d in self._domain_tuple]
+            self._value_matrix = tuple(product(*columns))
+        return self._value_matrix
+
+    def _row_to_set(self, i: int) -> DomainSliceSet:
+        """!
+        \brief convert a row of value_matrix into the scope product form
+        expected by factor functions
+        """
+        return frozenset(zip(self._var_names, self.value_matrix[i]))
+
+    @property
+    def value_table(self) -> array:
+        """!
+        \brief factor values of the rows of value_matrix
+
+        The factor function is evaluated once per row and the values are
+        stored as contiguous doubles rather than as a sequence of float
+        objects.
+        """
+        scope_products = self.scope_products
+        if self._value_table is None:
+            self._value_table = array("d", map(self.phi, scope_products))
+        return self._value_table
+
+    def phi_row(self, i: int) -> float:
+        """!
+        \brief obtain the factor value of the i-th row of value_matrix
+        """
+        return self.value_table[i]
+
+    @property
+    def fingerprint(self) -> int:
+        """!
+        \brief hash of the domain and the codomain values of this factor
+
+        Factors that are equal have the same fingerprint, so comparing
+        fingerprints lets us reject unequal factors without evaluating
+        their rows again. The value is computed once when it is first
+        accessed.
+        """
+        scope_products = self.scope_products
+        if self._fingerprint is None:
+            domain = frozenset(map(frozenset, self._domain_tuple))
+            rows = map(frozenset, scope_products)
+            codomain = frozenset(zip(rows, map(self.phi, scope_products)))
+            self._fingerprint = hash((domain, codomain))
+        return self._fingerprint
+
+    @property
+    def Z(self) -> float:
+        """!
+        \brief partition value of this factor over its own domain
+
+        \see BaseFactor.partition_value(domains)
+        """
+        value_table = self.value_table
+        if self._Z is None:
+            self._Z = sum(value_table)
+        return self._Z
+
     @classmethod
     def from_abstract_factor(cls, f: AbstractFactor):
         """!
@@ -162,7 +340,7 @@ class BaseFactor(AbstractFactor, GraphObject):
 
         \endcode
         """
-        return BaseFactor(gid=str(uuid4()), scope_vars=svars)
+        return BaseFactor(gid=new_gid(), scope_vars=svars)
 
     @classmethod
     def from_scope_variables_with_fn(
@@ -173,7 +351,7 @@ class BaseFactor(AbstractFactor, GraphObject):
         """!
         \brief Make a factor from scope variables and a preference function
         """
-        return BaseFactor(gid=str(uuid4()), scope_vars=svars, factor_fn=fn)
+        return BaseFactor(gid=new_gid(), scope_vars=svars, factor_fn=fn)
 
     def phi(self, scope_product: DomainSliceSet) -> float:
         """!
@@ -255,5 +433,14 @@ class BaseFactor(AbstractFactor, GraphObject):
         \endcode
 
         """
-        scope_matches = list(product(*domains))
-        return sum([self.phi(scope_product=sv) for sv in scope_matches])
+        self._check_domain_cache()
+        own_domains = self._vars_domain
+        if len(domains) == len(own_domains) and all(
+            d in own_domains for d in domains
+        ):
+            # the cached partition value only applies if every domain of the
+            # factor is given exactly once, in any order
+            positions = set([own_domains.index(d) for d in domains])
+            if len(positions) == len(own_domains):
+                return self.Z
+        return sum(map(self.phi, product(*domains)))
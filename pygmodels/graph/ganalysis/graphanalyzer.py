@@ -16,7 +16,6 @@ from pygmodels.graph.gtype.abstractobj import (
     AbstractEdge,
     AbstractGraph,
     AbstractNode,
-    EdgeType,
 )
 from pygmodels.graph.gtype.basegraph import BaseGraph
 from pygmodels.graph.gtype.gsearchresult import (
@@ -158,12 +157,47 @@ class BaseGraphBoolAnalyzer:
     def has_cycles(g: AbstractGraph) -> bool:
         """!
         \brief Check if graph instance contains cycles.
-        This interpretation is from Diestel 2017, p. 8. The
-        proof is provided in the given page.
+
+        Edges are considered regardless of their direction as in Diestel 2017,
+        p. 8. Every graph whose minimum degree is at least 2 contains a cycle,
+        but graphs with vertices of lower degree may contain one as well, so
+        we search for it.
+
+        We run an iterative depth first search keeping an explicit stack of
+        (node, edge to parent, incident edges) frames. Reaching an already
+        visited node through any edge other than the one leading back to the
+        parent closes a cycle. Self loops and parallel edges are cycles as
+        well.
         """
-        md = BaseGraphNumericAnalyzer.min_degree(g)
-        if md >= 2:
-            return True
+        V = {v.id(): v for v in g.V}
+        incident: Dict[str, List[AbstractEdge]] = {vid: [] for vid in V}
+        for e in g.E:
+            start_id = e.start().id()
+            end_id = e.end().id()
+            if start_id == end_id:
+                return True
+            if start_id in incident and end_id in incident:
+                incident[start_id].append(e)
+                incident[end_id].append(e)
+        visited: Set[str] = set()
+        for root in V:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, None, iter(incident[root]))]
+            while stack:
+                u, parent_edge, edges = stack[-1]
+                for e in edges:
+                    if e is parent_edge:
+                        continue
+                    v = e.get_other(V[u]).id()
+                    if v in visited:
+                        return True
+                    visited.add(v)
+                    stack.append((v, e, iter(incident[v])))
+                    break
+                else:
+                    stack.pop()
         return False
 
     @staticmethod
@@ -390,11 +424,46 @@ class BaseGraphNumericAnalyzer:
         """!
         \brief Give the shortest possible cycle length for graph instance
         The interpretation comes from Diestel 2017, p. 8.
+
+        This is the girth of the graph, edges being considered regardless of
+        their direction as in \see BaseGraphBoolAnalyzer.has_cycles. We run
+        a breadth first search from every vertex. A non tree edge joining
+        reached vertices u and v closes a closed walk of length
+        d(u) + d(v) + 1 containing a cycle at most that long, and the search
+        rooted on a vertex of a shortest cycle finds exactly its length.
+
+        \return 1 for a self loop, 2 for parallel edges and 0 if the graph
+        has no cycle.
         """
-        if BaseGraphAnalyzer.has_cycles(g):
-            return BaseGraphAnalyzer.min_degree(g) + 1
-        else:
-            return 0
+        V = {v.id(): v for v in g.V}
+        incident: Dict[str, List[AbstractEdge]] = {vid: [] for vid in V}
+        for e in g.E:
+            start_id = e.start().id()
+            end_id = e.end().id()
+            if start_id == end_id:
+                return 1
+            if start_id in incident and end_id in incident:
+                incident[start_id].append(e)
+                incident[end_id].append(e)
+        girth = 0
+        for root in V:
+            dist = {root: 0}
+            parent_edge = {root: None}
+            queue = [root]
+            for u in queue:
+                for e in incident[u]:
+                    if e is parent_edge[u]:
+                        continue
+                    v = e.get_other(V[u]).id()
+                    if v not in dist:
+                        dist[v] = dist[u] + 1
+                        parent_edge[v] = e
+                        queue.append(v)
+                        continue
+                    length = dist[u] + dist[v] + 1
+                    if girth == 0 or length < girth:
+                        girth = length
+        return girth
 
     @staticmethod
     def nb_neighbours_of(g: AbstractGraph, n: AbstractNode) -> int:
@@ -455,9 +524,12 @@ class BaseGraphNumericAnalyzer:
 
         This number makes more sense in the case of undirected graphs as our
         algorithm is adapted for that case. It is computed as we are traversing
-        the graph in dfs_forest()
+        the graph in dfs_forest(). When neither a search result nor an edge
+        generator is given, components are counted with union-find instead.
 
         """
+        if result is None and edge_generator is None:
+            return len(BaseGraphNodeAnalyzer.components_dsu(g))
         if not isinstance(result, BaseGraphDFSResult):
             result = BaseGraphAnalyzer.dfs_props(
                 g, edge_generator=edge_generator, check_cycle=check_cycle
@@ -536,6 +608,42 @@ class BaseGraphNodeAnalyzer:
         T.add(v.id())
         return set([V[v] for v in T])
 
+    @staticmethod
+    def components_dsu(g: AbstractGraph) -> List[Set[AbstractNode]]:
+        """!
+        \brief obtain node sets of connected components with union-find
+
+        Every edge joins the sets of its end vertices regardless of its
+        direction, so the result corresponds to the components found by a
+        depth first search over incident edges. Edges are visited once and
+        no search state is kept besides the parent of each node.
+        """
+        V = {v.id(): v for v in g.V}
+        parent = {vid: vid for vid in V}
+
+        def find(vid: str) -> str:
+            while parent[vid] != vid:
+                parent[vid] = parent[parent[vid]]
+                vid = parent[vid]
+            return vid
+
+        for e in g.E:
+            start_id = e.start().id()
+            end_id = e.end().id()
+            if start_id not in parent or end_id not in parent:
+                continue
+            r1 = find(start_id)
+            r2 = find(end_id)
+            if r1 != r2:
+                parent[r1] = r2
+        components: Dict[str, Set[AbstractNode]] = {}
+        for vid, v in V.items():
+            root = find(vid)
+            if root not in components:
+                components[root] = set()
+            components[root].add(v)
+        return list(components.values())
+
     @staticmethod
     def get_components_as_node_sets(
         g: AbstractGraph,
@@ -548,7 +656,17 @@ class BaseGraphNodeAnalyzer:
 
         The node set members of the returning set are of type frozenset due to
         set being an unhashable type in python.
+
+        Without a search result or an edge generator, components are found
+        with \see BaseGraphNodeAnalyzer.components_dsu.
         """
+        if result is None and edge_generator is None:
+            return set(
+                [
+                    frozenset(c)
+                    for c in BaseGraphNodeAnalyzer.components_dsu(g)
+                ]
+            )
         if not isinstance(result, BaseGraphDFSResult):
             result = BaseGraphAnalyzer.dfs_props(
                 g, edge_generator=edge_generator, check_cycle=check_cycle
@@ -688,8 +806,30 @@ class BaseGraphAnalyzer:
         """!
         \brief Get components of graph
 
-        Each component is provided as a graph
+        Each component is provided as a graph. Without a search result or an
+        edge generator, components are found with \see
+        BaseGraphNodeAnalyzer.components_dsu and edges are distributed to
+        them in a single pass.
         """
+        if result is None and edge_generator is None:
+            components = BaseGraphNodeAnalyzer.components_dsu(g)
+            if len(components) == 1:
+                return set([g])
+            index: Dict[str, int] = {}
+            for i, c in enumerate(components):
+                for v in c:
+                    index[v.id()] = i
+            edges: List[Set[AbstractEdge]] = [set() for c in components]
+            for e in g.E:
+                i = index.get(e.start().id())
+                if i is not None:
+                    edges[i].add(e)
+            return set(
+                [
+                    BaseGraph.from_edge_node_set(nodes=c, edges=es)
+                    for c, es in zip(components, edges)
+                ]
+            )
         if not isinstance(result, BaseGraphDFSResult):
             result = BaseGraphAnalyzer.dfs_props(
                 g, edge_generator=edge_generator, check_cycle=check_cycle
@@ -766,19 +906,7 @@ class BaseGraphAnalyzer:
 
         \endcode
         """
-        gmat = {}
-        for v in g.V:
-            for k in g.V:
-                gmat[(v.id(), k.id())] = vtype(0)
-        for edge in g.E:
-            tpl1 = (edge.start().id(), edge.end().id())
-            tpl2 = (edge.end().id(), edge.start().id())
-            if tpl1 in gmat:
-                gmat[tpl1] = vtype(1)
-            if edge.type() == EdgeType.UNDIRECTED:
-                if tpl2 in gmat:
-                    gmat[tpl2] = vtype(1)
-        return gmat
+        return BaseGraphOps.to_adjmat(g, vtype=vtype)
 
     @staticmethod
     def transitive_closure_matrix(
@@ -844,22 +972,44 @@ class BaseGraphAnalyzer:
 
         \endcode
 
+        """
+        index, rows = BaseGraphAnalyzer.transitive_closure_bits(g)
+        return {
+            (v, k): rows[i] >> j & 1 == 1
+            for v, i in index.items()
+            for k, j in index.items()
+            if v != k
+        }
+
+    @staticmethod
+    def transitive_closure_bits(
+        g: AbstractGraph,
+    ) -> Tuple[Dict[str, int], List[int]]:
+        """!
+        \brief Obtain transitive closure matrix of a given graph packed into
+        bit rows
+
+        Runs the Floyd-Roy-Warshall algorithm of \see
+        BaseGraphAnalyzer.transitive_closure_matrix on the rows of \see
+        BaseGraphOps.to_adjmat_bits. Every row whose k-th bit is set absorbs
+        the k-th row with a single bitwise or, so each step of the algorithm
+        handles a whole row of the matrix at once.
+
+        \throws ValueError we raise a value error if the graph has a self loop.
+
+        \return a pair whose first member maps node identifiers to row and
+        column indices. The j-th bit of the i-th row of the second member is
+        set if there is a path from the i-th node to the j-th node.
         """
         if BaseGraphBoolAnalyzer.has_self_loop(g):
             raise ValueError("Graph has a self loop")
-        #
-        T = BaseGraphAnalyzer.to_adjmat(g=g, vtype=bool)
-        #
-        n = list(g.V)
-        for k in n.copy():
-            for i in n.copy():
-                for j in n.copy():
-                    t_ij = T[(i.id(), j.id())]
-                    t_ik = T[(i.id(), k.id())]
-                    t_ki = T[(i.id(), k.id())]
-                    T[(i.id(), j.id())] = t_ij or (t_ik and t_ki)
-        T = {(k, i): v for (k, i), v in T.items() if k != i}
-        return T
+        index, rows = BaseGraphOps.to_adjmat_bits(g)
+        for k in range(len(rows)):
+            k_bit = 1 << k
+            for i, row_i in enumerate(rows):
+                if row_i & k_bit:
+                    rows[i] = row_i | rows[k]
+        return index, rows
 
     @staticmethod
     def transitive_closure(g: AbstractGraph):
@@ -63,14 +63,36 @@ class DiGraph(AbstractDiGraph, BaseGraph):
                         + " undirected edges"
                     )
         super().__init__(gid=gid, data=data, nodes=nodes, edges=edges)
-        self.path_props = {v.id(): self.find_shortest_paths(v) for v in self.V}
-        self.dprops = BaseGraphSearcher.depth_first_search(
-            self,
-            edge_generator=lambda x: BaseGraphEdgeOps.outgoing_edges_of(
-                self, x
-            ),
-            check_cycle=True,
-        )
+        ## shortest path results per node id, computed on first access
+        self._path_props = None
+        ## dfs result over outgoing edges, computed on first access
+        self._dprops = None
+
+    @property
+    def path_props(self):
+        """!
+        \brief breadth first search results keyed by the source node id
+        """
+        if self._path_props is None:
+            self._path_props = {
+                v.id(): self.find_shortest_paths(v) for v in self.V
+            }
+        return self._path_props
+
+    @property
+    def dprops(self):
+        """!
+        \brief depth first search result following outgoing edges
+        """
+        if self._dprops is None:
+            self._dprops = BaseGraphSearcher.depth_first_search(
+                self,
+                edge_generator=lambda x: BaseGraphEdgeOps.outgoing_edges_of(
+                    self, x
+                ),
+                check_cycle=True,
+            )
+        return self._dprops
 
     @classmethod
     def from_graph(cls, g: Graph):
@@ -118,9 +140,17 @@ class DiGraph(AbstractDiGraph, BaseGraph):
 
     def check_for_path(self, n1: Node, n2: Node) -> bool:
         "check if there is a path between nodes"
-        path_props = self.path_props[n1.id()]
-        pset = path_props.path_set
-        return n2 in pset
+        return BaseGraphSearcher.is_reachable(
+            self,
+            n1=n1,
+            n2=n2,
+            out_edge_generator=lambda x: BaseGraphEdgeOps.outgoing_edges_of(
+                self, x
+            ),
+            in_edge_generator=lambda x: BaseGraphEdgeOps.incoming_edges_of(
+                self, x
+            ),
+        )
 
     def __find_transitive_closure(self) -> Graph:
         """!
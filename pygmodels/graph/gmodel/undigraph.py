@@ -115,14 +115,22 @@ class UndiGraph(AbstractUndiGraph, BaseGraph):
         \param n1 source node
         \param n2 destination node
 
-        We search for the shortest paths that can be obtained from the source
-        node. Since we obtain also a vertex set that are reachable from the
-        source node, if the node is inside the vertex set, we consider that
-        there must be a path between source node and the destination node
+        We search from both nodes at the same time, every edge that is
+        incident with a node is followed in both directions. If the searches
+        meet, there must be a path between source node and the destination
+        node, \see BaseGraphSearcher.is_reachable
         """
-        paths = self.find_shortest_path(n1)
-        n1_vertices = paths["path-set"]
-        return n2 in n1_vertices
+
+        def edge_gen(x):
+            return BaseGraphEdgeOps.edges_of(self, x)
+
+        return BaseGraphSearcher.is_reachable(
+            self,
+            n1=n1,
+            n2=n2,
+            out_edge_generator=edge_gen,
+            in_edge_generator=edge_gen,
+        )
 
     def lower_bound_for_path_length(self) -> int:
         """!
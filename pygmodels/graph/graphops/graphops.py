@@ -174,34 +174,14 @@ class BaseGraphBoolOps:
 
         \endcode
         """
-        if not BaseGraphBoolOps.is_in(g, n1):
+        adjacency = BaseGraphNodeOps.adjacency_view(g)
+        if n1.id() not in adjacency:
             raise ValueError("node not in graph")
 
-        if not BaseGraphBoolOps.is_in(g, n2):
+        if n2.id() not in adjacency:
             raise ValueError("node not in graph")
 
-        def cond(
-            n_1: AbstractNode, n_2: AbstractNode, e: AbstractEdge
-        ) -> bool:
-            """!
-            \brief neighborhood condition
-            """
-            estart = e.start()
-            eend = e.end()
-            c1 = estart == n_1 and eend == n_2
-            c2 = estart == n_2 and eend == n_1
-            return c1 or c2
-
-        gdata = BaseGraphOps.to_edgelist(g)
-
-        n1_edge_ids = set(gdata[n1.id()])
-        n2_edge_ids = set(gdata[n2.id()])
-        edge_ids = n1_edge_ids.intersection(n2_edge_ids)
-        # filter self loops
-        edges = set([e for e in g.E if e.id() in edge_ids])
-        return BaseGraphBoolOps.is_related_to(
-            g, n1=n1, n2=n2, condition=cond, es=edges
-        )
+        return n2.id() in adjacency[n1.id()]
 
 
 class BaseGraphEdgeOps:
@@ -209,6 +189,53 @@ class BaseGraphEdgeOps:
     \brief Operations that output edge or set of edges involving base graphs
     """
 
+    @staticmethod
+    def incidence_maps(
+        g: AbstractGraph,
+    ) -> Tuple[
+        Dict[str, Tuple[AbstractEdge, ...]],
+        Dict[str, Tuple[AbstractEdge, ...]],
+    ]:
+        """!
+        \brief obtain outgoing and incoming edges of every node of the graph
+
+        Both maps are built in a single pass over the edges and are keyed by
+        node identifiers. Undirected edges are both outgoing and incoming
+        edges of their end vertices, see \see Edge.is_start and
+        \see Edge.is_end.
+
+        Vertex and edge sets of graphs are immutable, so the maps are stored
+        on graphs having an _incidence attribute, \see BaseGraph, until the
+        graph returns different vertex or edge set objects. Edges are kept in
+        tuples rather than sets, since their hashes change with the data of
+        their nodes.
+        """
+        V = g.V
+        E = g.E
+        cached = getattr(g, "_incidence", None)
+        if cached is not None and cached[0] is E and cached[1] is V:
+            return cached[2], cached[3]
+        outs: Dict[str, list] = {v.id(): [] for v in V}
+        ins: Dict[str, list] = {v.id(): [] for v in V}
+        for e in E:
+            if e.type() == EdgeType.UNDIRECTED:
+                for nid in e.node_ids():
+                    if nid in outs:
+                        outs[nid].append(e)
+                        ins[nid].append(e)
+            else:
+                start_id = e.start().id()
+                end_id = e.end().id()
+                if start_id in outs:
+                    outs[start_id].append(e)
+                if end_id in ins:
+                    ins[end_id].append(e)
+        out_map = {nid: tuple(es) for nid, es in outs.items()}
+        in_map = {nid: tuple(es) for nid, es in ins.items()}
+        if hasattr(g, "_incidence"):
+            g._incidence = (E, V, out_map, in_map)
+        return out_map, in_map
+
     @staticmethod
     def edges_of(g: AbstractGraph, n: AbstractNode) -> Set[AbstractEdge]:
         """!
@@ -293,17 +320,11 @@ class BaseGraphEdgeOps:
 
         \endcode
         """
-        if not BaseGraphBoolOps.is_in(g, n):
+        out_map, _ = BaseGraphEdgeOps.incidence_maps(g)
+        edges = out_map.get(n.id())
+        if edges is None:
             raise ValueError("node not in Graph")
-
-        eset = set()
-        E = {e.id(): e for e in g.E}
-        gdata = BaseGraphOps.to_edgelist(g)
-        for eid in gdata[n.id()]:
-            e = E[eid]
-            if e.is_start(n):
-                eset.add(e)
-        return frozenset(eset)
+        return frozenset(edges)
 
     @staticmethod
     def incoming_edges_of(
@@ -339,17 +360,11 @@ class BaseGraphEdgeOps:
 
         \endcode
         """
-        if not BaseGraphBoolOps.is_in(g, n):
+        _, in_map = BaseGraphEdgeOps.incidence_maps(g)
+        edges = in_map.get(n.id())
+        if edges is None:
             raise ValueError("node not in Graph")
-
-        eset = set()
-        gdata = BaseGraphOps.to_edgelist(g)
-        E = {e.id(): e for e in g.E}
-        for eid in gdata[n.id()]:
-            e = E[eid]
-            if e.is_end(n):
-                eset.add(e)
-        return frozenset(eset)
+        return frozenset(edges)
 
     @staticmethod
     def edges_by_end(g: AbstractGraph, n: AbstractNode) -> Set[AbstractEdge]:
@@ -431,6 +446,47 @@ class BaseGraphNodeOps:
     \brief Operations that output a node or a set of nodes involving graphs
     """
 
+    @staticmethod
+    def _adjacency(
+        g: AbstractGraph,
+    ) -> Tuple[Dict[str, AbstractNode], Dict[str, FrozenSet[str]]]:
+        """!
+        \brief obtain vertices by identifier along with the adjacency view
+
+        Both are built in a single pass over the edges and stored on graphs
+        having an _adjacency attribute, \see BaseGraph, like
+        \see BaseGraphEdgeOps.incidence_maps.
+        """
+        V = g.V
+        E = g.E
+        cached = getattr(g, "_adjacency", None)
+        if cached is not None and cached[0] is E and cached[1] is V:
+            return cached[2], cached[3]
+        vmap = {v.id(): v for v in V}
+        adj: Dict[str, set] = {nid: set() for nid in vmap}
+        for e in E:
+            start_id = e.start().id()
+            end_id = e.end().id()
+            if start_id in adj and end_id in adj:
+                adj[start_id].add(end_id)
+                adj[end_id].add(start_id)
+        view = {nid: frozenset(ns) for nid, ns in adj.items()}
+        if hasattr(g, "_adjacency"):
+            g._adjacency = (E, V, vmap, view)
+        return vmap, view
+
+    @staticmethod
+    def adjacency_view(g: AbstractGraph) -> Dict[str, FrozenSet[str]]:
+        """!
+        \brief obtain the neighbour identifiers of every node of the graph
+
+        The view maps node identifiers to the identifiers of vertices sharing
+        an edge with them, regardless of the direction of the edge. A node
+        with a self loop is its own neighbour. Identifiers are used instead
+        of nodes, since node hashes change with their data.
+        """
+        return BaseGraphNodeOps._adjacency(g)[1]
+
     @staticmethod
     def get_nodes(
         ns: Optional[Set[AbstractNode]],
@@ -523,13 +579,10 @@ class BaseGraphNodeOps:
 
         \endcode
         """
-        if not BaseGraphBoolOps.is_in(g, n1):
+        vmap, adjacency = BaseGraphNodeOps._adjacency(g)
+        if n1.id() not in adjacency:
             raise ValueError("node is not in graph")
-        neighbours = set()
-        for n2 in g.V:
-            if BaseGraphBoolOps.is_neighbour_of(g, n1=n1, n2=n2) is True:
-                neighbours.add(n2)
-        return neighbours
+        return set([vmap[nid] for nid in adjacency[n1.id()]])
 
     @staticmethod
     def vertex_by_id(g: AbstractGraph, node_id: str) -> AbstractNode:
@@ -640,19 +693,36 @@ class BaseGraphOps:
 
         \endcode
         """
-        gmat = {}
-        for v in g.V:
-            for k in g.V:
-                gmat[(v.id(), k.id())] = vtype(0)
+        index, rows = BaseGraphOps.to_adjmat_bits(g)
+        zero = vtype(0)
+        one = vtype(1)
+        return {
+            (v, k): one if rows[i] >> j & 1 else zero
+            for v, i in index.items()
+            for k, j in index.items()
+        }
+
+    @staticmethod
+    def to_adjmat_bits(g: AbstractGraph) -> Tuple[Dict[str, int], List[int]]:
+        """!
+        \brief Transform graph to an adjacency matrix packed into bit rows
+
+        \return a pair whose first member maps node identifiers to row and
+        column indices. The second member holds one integer per row: the
+        j-th bit of the i-th row is set if there is an edge from the i-th
+        node to the j-th node. Undirected edges set both directions.
+        """
+        index = {v.id(): i for i, v in enumerate(g.V)}
+        rows = [0] * len(index)
         for edge in g.E:
-            tpl1 = (edge.start().id(), edge.end().id())
-            tpl2 = (edge.end().id(), edge.start().id())
-            if tpl1 in gmat:
-                gmat[tpl1] = vtype(1)
+            i = index.get(edge.start().id())
+            j = index.get(edge.end().id())
+            if i is None or j is None:
+                continue
+            rows[i] |= 1 << j
             if edge.type() == EdgeType.UNDIRECTED:
-                if tpl2 in gmat:
-                    gmat[tpl2] = vtype(1)
-        return gmat
+                rows[j] |= 1 << i
+        return index, rows
 
     @staticmethod
     def get_subgraph_by_vertices(
@@ -223,24 +223,32 @@ class BaseGraphSearcher:
         if not BaseGraphBoolOps.is_in(g, n1):
             raise ValueError("argument node is not in graph")
         nid = n1.id()
-        Q = [nid]
         V: Dict[str, AbstractNode] = {v.id(): v for v in g.V}
         l_vs = {v: math.inf for v in V}
         l_vs[nid] = 0
         T = set([nid])
         P: Dict[str, Dict[str, str]] = {}
         P[nid] = {}
-        while Q:
-            u = Q.pop(0)
-            unode = V[u]
-            for edge in edge_generator(unode):
-                vnode = edge.get_other(unode)
-                vid = vnode.id()
-                if vid not in T:
-                    T.add(vid)
-                    l_vs[vid] = int(l_vs[u] + 1)
-                    P[nid][u] = vid
-                    Q.append(vid)
+        tree = P[nid]
+        nb_nodes = len(V)
+        # visit the graph level by level, once every node is discovered the
+        # remaining nodes of the frontier can not add anything
+        level = [nid]
+        while level and len(T) < nb_nodes:
+            next_level = []
+            for u in level:
+                unode = V[u]
+                u_dist = int(l_vs[u] + 1)
+                for edge in edge_generator(unode):
+                    vid = edge.get_other(unode).id()
+                    if vid not in T:
+                        T.add(vid)
+                        l_vs[vid] = u_dist
+                        tree[u] = vid
+                        next_level.append(vid)
+                if len(T) == nb_nodes:
+                    break
+            level = next_level
         #
         T = set([V[t] for t in T])
         path_props = {"bfs-tree": P, "path-set": T, "top-sort": l_vs}
@@ -251,6 +259,62 @@ class BaseGraphSearcher:
             data={},
         )
 
+    @staticmethod
+    def is_reachable(
+        g: AbstractGraph,
+        n1: AbstractNode,
+        n2: AbstractNode,
+        out_edge_generator: Callable[[AbstractNode], Set[AbstractEdge]],
+        in_edge_generator: Callable[[AbstractNode], Set[AbstractEdge]],
+    ) -> bool:
+        """!
+        \brief check if n2 can be reached from n1 with a bidirectional
+        breadth first search
+
+        A forward search follows the edges of out_edge_generator from n1 and
+        a backward search follows the edges of in_edge_generator from n2. At
+        each step the smaller frontier is expanded by one level, and the
+        search stops as soon as a node is visited by both searches.
+
+        \throws ValueError if n1 is not found in graph instance
+        """
+        V: Dict[str, AbstractNode] = {v.id(): v for v in g.V}
+        src = n1.id()
+        dst = n2.id()
+        if src not in V:
+            raise ValueError("argument node is not in graph")
+        if dst not in V:
+            return False
+        if src == dst:
+            return True
+        fwd_seen = set([src])
+        bwd_seen = set([dst])
+        fwd = [src]
+        bwd = [dst]
+        while fwd and bwd:
+            is_forward = len(fwd) <= len(bwd)
+            if is_forward:
+                level, seen, other = fwd, fwd_seen, bwd_seen
+                edge_generator = out_edge_generator
+            else:
+                level, seen, other = bwd, bwd_seen, fwd_seen
+                edge_generator = in_edge_generator
+            next_level = []
+            for u in level:
+                unode = V[u]
+                for edge in edge_generator(unode):
+                    vid = edge.get_other(unode).id()
+                    if vid in other:
+                        return True
+                    if vid not in seen:
+                        seen.add(vid)
+                        next_level.append(vid)
+            if is_forward:
+                fwd = next_level
+            else:
+                bwd = next_level
+        return False
+
     @staticmethod
     def uniform_cost_search(
         g: AbstractGraph,
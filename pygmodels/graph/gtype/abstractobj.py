@@ -35,6 +35,8 @@ def type_check_msg(ival, itype, mname: str):
 class AbstractInfo(ABC):
     """"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """"""
         self.check_types()
@@ -53,6 +55,8 @@ class AbstractInfo(ABC):
 class AbstractGraphObj(AbstractInfo):
     "Abstract graph object"
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.check_types()
@@ -96,10 +100,14 @@ class EdgeType(Enum):
 class AbstractNode(AbstractGraphObj):
     """"""
 
+    __slots__ = ()
+
 
 class AbstractEdge(AbstractGraphObj):
     "abstract edge object"
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """"""
         super().__init__(*args, **kwargs)
@@ -5,12 +5,6 @@ functionality for doing graph theoretical operations
 from typing import Callable, Dict, FrozenSet, List, Optional, Set, Union
 from uuid import uuid4
 
-from pygmodels.graph.graphops.graphops import (
-    BaseGraphBoolOps,
-    BaseGraphEdgeOps,
-    BaseGraphNodeOps,
-    BaseGraphOps,
-)
 from pygmodels.graph.gtype.abstractobj import (
     AbstractEdge,
     AbstractGraph,
@@ -38,16 +32,31 @@ class BaseGraph(GraphObject, AbstractGraph):
             raise TypeError("Nodes must be a set or a frozenset")
         if not isinstance(edges, (frozenset, set)):
             raise TypeError("Edges must be a set or a frozenset")
-        self._nodes: FrozenSet[AbstractNode] = BaseGraphNodeOps.get_nodes(
-            ns=nodes, es=edges
-        )
+        # a single pass over edges collects their end vertices and fills
+        # the edge list representation at the same time
+        vertices = set(nodes)
+        gdata: Dict[str, List[str]] = {v.id(): [] for v in vertices}
+        for e in edges:
+            vertices.add(e.start())
+            vertices.add(e.end())
+            eid = e.id()
+            for node_id in e.node_ids():
+                elist = gdata.get(node_id)
+                if elist is None:
+                    gdata[node_id] = [eid]
+                else:
+                    elist.append(eid)
+        self._nodes: FrozenSet[AbstractNode] = frozenset(vertices)
         self._edges: FrozenSet[AbstractEdge] = frozenset(edges)
         #
-        self.gdata: Dict[str, List[str]] = BaseGraphOps.to_edgelist(self)
-        if self._nodes is not None:
-            self.is_empty = len(self._nodes) == 0
-        else:
-            self.is_empty = True
+        self.gdata: Dict[str, List[str]] = gdata
+        self.is_empty = len(self._nodes) == 0
+        ## outgoing and incoming edges per node identifier, built on first
+        ## use by BaseGraphEdgeOps.incidence_maps
+        self._incidence = None
+        ## neighbour identifiers per node identifier, built on first use by
+        ## BaseGraphNodeOps.adjacency_view
+        self._adjacency = None
 
     @classmethod
     def from_abstract_graph(cls, g_: AbstractGraph):
@@ -98,6 +107,8 @@ class BaseGraph(GraphObject, AbstractGraph):
 
         \endcode
         """
+        if n is self:
+            return True
         if isinstance(n, BaseGraph):
             return self.id() == n.id()
         return False
@@ -21,6 +21,8 @@ class Edge(GraphObject, AbstractEdge):
     An edge in a graph object.
     """
 
+    __slots__ = ("etype", "start_node", "end_node")
+
     def __init__(
         self,
         edge_id: str,
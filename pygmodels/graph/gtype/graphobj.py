@@ -9,6 +9,8 @@ from pygmodels.graph.gtype.abstractobj import AbstractGraphObj
 class GraphObject(AbstractGraphObj):
     """!object contained in a graph"""
 
+    __slots__ = ("object_id", "object_data")
+
     def __init__(self, oid: str, odata={}):
         """!"""
         self.object_id = oid
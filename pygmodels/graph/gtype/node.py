@@ -25,6 +25,8 @@ class Node(AbstractNode, GraphObject):
     types of graphs. It does not know its edges.
     """
 
+    __slots__ = ()
+
     def __init__(self, node_id: str, data={}):
         "constructor for a node"
         super().__init__(oid=node_id, odata=data)
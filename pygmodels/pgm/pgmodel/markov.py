@@ -1,7 +1,6 @@
 """!
 Markov network
 """
-import pdb
 from typing import Optional, Set, Tuple
 from uuid import uuid4
 
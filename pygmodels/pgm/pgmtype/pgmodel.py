@@ -11,7 +11,19 @@ generic model, hence we do not assume a particular independence structure.
 
 """
 import math
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import Executor
+from functools import reduce as freduce
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from uuid import uuid4
 
 from pygmodels.factor.factorf.factoralg import FactorAlgebra
@@ -38,20 +50,97 @@ from pygmodels.graph.gtype.node import Node
 from pygmodels.pgm.pgmtype.randomvariable import NumCatRVariable, NumericValue
 
 
+def domain_size(f: AbstractFactor) -> int:
+    """!
+    \brief number of rows in the domain of the given factor
+    """
+    return freduce(lambda acc, s: acc * len(s.values()), f.scope_vars(), 1)
+
+
+def factor_components(
+    factors: Set[AbstractFactor]
+) -> List[Set[AbstractFactor]]:
+    """!
+    \brief partition factors into groups that do not share scope variables
+
+    Two factors are in the same group if they are connected through a chain
+    of factors whose consecutive members share a variable. Groups are found
+    with a union-find over factors.
+    """
+    fs = list(factors)
+    parent = list(range(len(fs)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner: Dict[str, int] = {}
+    for i, f in enumerate(fs):
+        for s in f.scope_vars():
+            j = owner.setdefault(s.id(), i)
+            parent[find(i)] = find(j)
+    groups: Dict[int, Set[AbstractFactor]] = {}
+    for i, f in enumerate(fs):
+        groups.setdefault(find(i), set()).add(f)
+    return list(groups.values())
+
+
+def factor_index(
+    factors: Set[AbstractFactor]
+) -> DefaultDict[str, Set[AbstractFactor]]:
+    """!
+    \brief map variable identifiers to factors whose scope contains them
+    """
+    index: DefaultDict[str, Set[AbstractFactor]] = defaultdict(set)
+    for f in factors:
+        for s in f.scope_vars():
+            index[s.id()].add(f)
+    return index
+
+
 def min_unmarked_neighbours(
     g: Graph, nodes: Set[Node], marked: Dict[str, Node]
 ):
     """!
     \brief find an unmarked node with minimum number of neighbours
     """
-    ordered = [
-        (n, BaseGraphNumericAnalyzer.nb_neighbours_of(g, n)) for n in nodes
-    ]
-    ordered.sort(key=lambda x: x[1])
-    for X, nb in sorted(ordered, key=lambda x: x[1]):
-        if marked[X.id()] is False:
-            return X
-    return None
+    unmarked = [n for n in nodes if marked[n.id()] is False]
+    if len(unmarked) == 0:
+        return None
+    return min(
+        unmarked, key=lambda n: BaseGraphNumericAnalyzer.nb_neighbours_of(g, n)
+    )
+
+
+def min_unmarked_fill_edges(
+    g: Graph, nodes: Set[Node], marked: Dict[str, Node]
+):
+    """!
+    \brief find an unmarked node whose elimination adds the minimum number of
+    fill edges
+
+    Min-fill cost criterion from Koller and Friedman 2009, p. 314. The cost of
+    a node is the number of pairs of its neighbours that are not already
+    connected. Ties are broken by the number of neighbours.
+    """
+    X = None
+    X_cost = None
+    for n in nodes:
+        if marked[n.id()] is True:
+            continue
+        ns = list(BaseGraphNodeOps.neighbours_of(g, n))
+        nb_fill = 0
+        for i in range(len(ns)):
+            for j in range(i + 1, len(ns)):
+                if not BaseGraphBoolOps.is_neighbour_of(g, ns[i], ns[j]):
+                    nb_fill += 1
+        cost = (nb_fill, len(ns))
+        if X_cost is None or cost < X_cost:
+            X = n
+            X_cost = cost
+    return X
 
 
 class PGModel(Graph):
@@ -73,6 +162,8 @@ class PGModel(Graph):
         Most of the parameters are documented in #Graph.
         """
         super().__init__(gid=gid, data=data, nodes=nodes, edges=edges)
+        ## vertices by their identifiers, computed on first access
+        self._v_by_id = None
         if factors is None:
             fs: Set[BaseFactor] = set()
             for e in self.E:
@@ -95,6 +186,15 @@ class PGModel(Graph):
         else:
             self.Fs = factors
 
+    @property
+    def V_by_id(self) -> Dict[str, NumCatRVariable]:
+        """!
+        \brief vertices of the model by their identifiers
+        """
+        if self._v_by_id is None:
+            self._v_by_id = {v.id(): v for v in self.V}
+        return self._v_by_id
+
     def markov_blanket(self, t: NumCatRVariable) -> Set[NumCatRVariable]:
         """!
         get markov blanket of a node from K. Murphy, 2012, p. 662
@@ -104,10 +204,15 @@ class PGModel(Graph):
         ns: Set[NumCatRVariable] = BaseGraphNodeOps.neighbours_of(self, t)
         return ns
 
-    def factors(self, f=lambda x: x):
+    def factors(self, f: Optional[Callable[[BaseFactor], Any]] = None):
         """!
         Get factors of graph
+
+        \param f function applied to each factor. When it is not given the
+        factor set is copied without calling a function per factor.
         """
+        if f is None:
+            return set(self.Fs)
         return set([f(ff) for ff in self.Fs])
 
     def closure_of(self, t: NumCatRVariable) -> Set[NumCatRVariable]:
@@ -136,19 +241,14 @@ class PGModel(Graph):
         """!
         filter factors using Koller, Friedman 2009, p. 299 as criteria
         """
-        s: Set[NumCatRVariable] = self.scope_of(phi)
-        return s.intersection(X) == s
+        return self.scope_of(phi).issubset(X)
 
     def scope_subset_factors(self, X: Set[NumCatRVariable]) -> Set[BaseFactor]:
         """!
         choose factors using Koller, Friedman 2009, p. 299 as criteria
         """
         return set(
-            [
-                f
-                for f in self.factors()
-                if self.is_scope_subset_of(f, X) is True
-            ]
+            [f for f in self.Fs if self.is_scope_subset_of(f, X) is True]
         )
 
     def get_factor_product(self, fs: Set[BaseFactor]):
@@ -161,14 +261,16 @@ class PGModel(Graph):
             raise ValueError("Must have a non empty list of factors")
         if len(factors) == 1:
             return factors[0], None
-        prod = factors.pop(0)
-        for i in range(0, len(factors)):
-            prod, val = FactorAlgebra.product(
-                f=prod,
-                other=factors[i],
-                product_fn=lambda x, y: x * y,
-                accumulator=lambda x, y: x * y,
-            )
+        # multiply small factors first to keep intermediate products small
+        factors.sort(key=domain_size)
+        if len(factors) > 2:
+            # evaluate the joint domain at once instead of building a table
+            # for every intermediate product
+            return FactorAlgebra.products(factors)
+        it = iter(factors)
+        prod = next(it)
+        for other in it:
+            prod, val = FactorAlgebra.product(f=prod, other=other)
         return prod, val
 
     def get_factor_product_var(
@@ -177,10 +279,15 @@ class PGModel(Graph):
         """!
         Get products of factors whose scope involves variable Z.
         """
-        factors = set([f for f in fs if Z in self.scope_of(f)])
-        other_factors = set([f for f in fs if f not in factors])
+        factors = set()
+        other_factors = set()
+        for f in fs:
+            if Z in self.scope_of(f):
+                factors.add(f)
+            else:
+                other_factors.add(f)
         prod, v = self.get_factor_product(factors)
-        return prod, set(factors), other_factors
+        return prod, factors, other_factors
 
     def eliminate_variable_by(
         self,
@@ -196,7 +303,7 @@ class PGModel(Graph):
             factors, Z
         )
         sum_factor = elimination_strategy(prod, Z)
-        other_factors = other_factors.union({sum_factor})
+        other_factors.add(sum_factor)
         return other_factors, sum_factor, prod
 
     def sum_prod_var_eliminate(
@@ -216,7 +323,10 @@ class PGModel(Graph):
         return res[0]
 
     def sum_product_elimination(
-        self, factors: Set[BaseFactor], Zs: List[NumCatRVariable]
+        self,
+        factors: Set[BaseFactor],
+        Zs: List[NumCatRVariable],
+        executor: Optional[Executor] = None,
     ) -> BaseFactor:
         """!
         sum product variable elimination
@@ -227,37 +337,110 @@ class PGModel(Graph):
 
         \param Zs elimination variables. They correspond to all variables that
         are not query variables.
+
+        \param executor an optional concurrent.futures executor. If the
+        factors split into several groups that do not share variables, see
+        \see factor_components, each group is eliminated in its own task and
+        the results are multiplied at the end. A process pool requires
+        picklable factor functions.
+
+        Factors are looked up through an index from variable identifiers to
+        the factors whose scope contains them, which is updated as factors
+        are consumed and produced, so an elimination step does not scan the
+        whole factor set. An elimination step only multiplies factors that
+        share its variable, so factors that do not share variables, directly
+        or through other factors, first meet in the final product.
         """
+        if executor is not None:
+            components = factor_components(factors)
+            if len(components) > 1:
+                return self.sum_product_elimination_by_component(
+                    components, Zs, executor
+                )
+        remaining = set(factors)
+        index = factor_index(remaining)
         for Z in Zs:
-            factors = self.sum_prod_var_eliminate(factors, Z)
+            scope_factors = index.pop(Z.id(), None)
+            if not scope_factors:
+                raise ValueError(
+                    "Variable is not in scope of any factor: " + Z.id()
+                )
+            prod, v = self.get_factor_product(scope_factors)
+            sum_factor = FactorAlgebra.sumout_var(prod, Z)
+            remaining.difference_update(scope_factors)
+            for f in scope_factors:
+                for s in f.scope_vars():
+                    if s.id() != Z.id():
+                        index[s.id()].discard(f)
+            remaining.add(sum_factor)
+            for s in sum_factor.scope_vars():
+                index[s.id()].add(sum_factor)
+
+        prod, v = self.get_factor_product(remaining)
+        return prod
 
-        prod, v = self.get_factor_product(factors)
+    def sum_product_elimination_by_component(
+        self,
+        components: List[Set[BaseFactor]],
+        Zs: List[NumCatRVariable],
+        executor: Executor,
+    ) -> BaseFactor:
+        """!
+        \brief eliminate variables of independent factor groups in separate
+        tasks
+
+        \param components factor groups that do not share variables
+        \param Zs elimination variables, kept in their order within each group
+        \param executor executor running the elimination of each group
+
+        \see PGModel.sum_product_elimination
+        """
+        component_of: Dict[str, int] = {}
+        for i, component in enumerate(components):
+            for f in component:
+                for s in f.scope_vars():
+                    component_of[s.id()] = i
+        component_Zs: List[List[NumCatRVariable]] = [[] for c in components]
+        for Z in Zs:
+            i = component_of.get(Z.id())
+            if i is None:
+                raise ValueError(
+                    "Variable is not in scope of any factor: " + Z.id()
+                )
+            component_Zs[i].append(Z)
+        futures = [
+            executor.submit(self.sum_product_elimination, c, c_Zs)
+            for c, c_Zs in zip(components, component_Zs)
+        ]
+        prods = set([future.result() for future in futures])
+        prod, v = self.get_factor_product(prods)
         return prod
 
-    def order_by_max_cardinality(self, nodes: Set[NumCatRVariable]):
+    def order_by_max_cardinality(
+        self, nodes: Set[NumCatRVariable]
+    ) -> Dict[str, int]:
         """!
         from Koller and Friedman 2009, p. 312
+
+        Positions are assigned from the last to the first: at each step the
+        unmarked node with the largest number of marked neighbours is
+        selected. Neighbourhoods are computed once and the number of marked
+        neighbours is updated as nodes are marked.
         """
-        marked = {n.id(): False for n in nodes}
-        cardinality = {n.id(): -1 for n in nodes}
-        unmarked_node_with_largest_marked_neighbor = None
-        nb_marked_neighbours = float("-inf")
-        for i in range(len(nodes)):
-            for n in nodes:
-                if marked[n.id()] is True:
-                    continue
-                nb_marked_neighbours_counter = 0
-                for n_ in BaseGraphNodeOps.neighbours_of(self, n):
-                    if marked[n_.id()] is False:
-                        nb_marked_neighbours_counter += 1
-                #
-                if nb_marked_neighbours_counter > nb_marked_neighbours:
-                    nb_marked_neighbours = nb_marked_neighbours_counter
-                    unmarked_node_with_largest_marked_neighbor = n
-            #
-            cardinality[n.id()] = i
-            marked[n.id()] = True
-        #
+        neighbours = {
+            n.id(): [m.id() for m in BaseGraphNodeOps.neighbours_of(self, n)]
+            for n in nodes
+        }
+        nb_marked_neighbours = {nid: 0 for nid in neighbours}
+        unmarked = list(neighbours)
+        cardinality = {}
+        for k in range(len(unmarked) - 1, -1, -1):
+            X = max(unmarked, key=nb_marked_neighbours.__getitem__)
+            unmarked.remove(X)
+            cardinality[X] = k
+            for m in neighbours[X]:
+                if m in nb_marked_neighbours:
+                    nb_marked_neighbours[m] += 1
         return cardinality
 
     def order_by_greedy_metric(
@@ -269,23 +452,62 @@ class PGModel(Graph):
     ) -> Dict[str, int]:
         """!
         From Koller and Friedman 2009, p. 314
+
+        \return the elimination step of each node keyed by its identifier.
+        \see PGModel.elimination_sequence_by_greedy_metric for the nodes
+        themselves in elimination order.
         """
         marked = {n.id(): False for n in nodes}
         cardinality = {n.id(): -1 for n in nodes}
+        g = self
+        # neighbour identifiers of visited nodes, kept up to date with the
+        # fill edges so that they are not recomputed from the graph
+        adj: Dict[str, Set[str]] = {}
+
+        def neighbour_ids(n: Node) -> Set[str]:
+            if n.id() not in adj:
+                adj[n.id()] = set(
+                    [m.id() for m in BaseGraphNodeOps.neighbours_of(g, n)]
+                )
+            return adj[n.id()]
+
         for i in range(len(nodes)):
-            X = s(g=self, nodes=nodes, marked=marked)
+            X = s(g=g, nodes=nodes, marked=marked)
             if X is not None:
                 cardinality[X.id()] = i
-                TEMP = BaseGraphNodeOps.neighbours_of(self, X)
-                while TEMP:
-                    n_x = TEMP.pop()
-                    for n in BaseGraphNodeOps.neighbours_of(self, X):
-                        self = BaseGraphAlgOps.added_edge_between_if_none(
-                            self, n_x, n, is_directed=False
-                        )
+                nbrs = list(BaseGraphNodeOps.neighbours_of(g, X))
+                fill_edges = set()
+                for j, n_x in enumerate(nbrs):
+                    for n in nbrs[j + 1 :]:
+                        if n.id() not in neighbour_ids(n_x):
+                            e = Edge.undirected(
+                                eid=str(uuid4()), start_node=n_x, end_node=n
+                            )
+                            fill_edges.add(e)
+                            neighbour_ids(n_x).add(n.id())
+                            neighbour_ids(n).add(n_x.id())
+                if fill_edges:
+                    g = BaseGraphAlgOps.add(g, fill_edges)
                 marked[X.id()] = True
         return cardinality
 
+    def elimination_sequence_by_greedy_metric(
+        self,
+        nodes: Set[NumCatRVariable],
+        s: Callable[
+            [Graph, Dict[Node, bool]], Optional[Node]
+        ] = min_unmarked_neighbours,
+    ) -> List[NumCatRVariable]:
+        """!
+        \brief nodes in the order they are eliminated by the greedy metric
+
+        Sorts the steps computed by \see PGModel.order_by_greedy_metric into
+        a list of nodes that can be passed to elimination functions.
+        """
+        cardinality = self.order_by_greedy_metric(nodes=nodes, s=s)
+        V = self.V_by_id
+        return [V[nid] for nid in sorted(cardinality, key=cardinality.get)]
+
     def reduce_queries_with_evidence(
         self,
         queries: Set[NumCatRVariable],
@@ -309,17 +531,24 @@ class PGModel(Graph):
         """
         if len(evidences) == 0:
             return self.factors(), set()
-        if any(e[0] not in {v.id() for v in self.V} for e in evidences):
+        V = self.V_by_id
+        if any(e[0] not in V for e in evidences):
             raise ValueError(
                 "evidence set contains variables out of vertices of graph"
             )
-        elist = [e[0] for e in evidences]
-        E = set([v for v in self.V if v.id() in elist])
-        fs = self.factors()
+        E = set([V[e[0]] for e in evidences])
+        evidence_ids = set([e[0] for e in evidences])
+        # factors without evidence variables in their scope are kept as is.
+        # Scopes are compared by identifier, since variable hashes change
+        # with their data
         factors = set(
             [
                 FactorAlgebra.reduced_by_value(f, assignments=evidences)
-                for f in fs
+                if not evidence_ids.isdisjoint(
+                    [s.id() for s in f.scope_vars()]
+                )
+                else f
+                for f in self.Fs
             ]
         )
         return factors, E
@@ -358,12 +587,9 @@ class PGModel(Graph):
         """!
         Main conditional product by variable elimination function
         """
-        cardinality = self.order_by_greedy_metric(nodes=Zs, s=ordering_fn)
-        V = {v.id(): v for v in self.V}
-        ordering = [
-            V[n[0]]
-            for n in sorted(list(cardinality.items()), key=lambda x: x[1])
-        ]
+        ordering = self.elimination_sequence_by_greedy_metric(
+            nodes=Zs, s=ordering_fn
+        )
         phi = self.sum_product_elimination(factors=factors, Zs=ordering)
         alpha = FactorAlgebra.sumout_vars(phi, queries)
         return phi, alpha
@@ -406,14 +632,9 @@ class PGModel(Graph):
         for z in self.V:
             if z not in E:
                 Zs.add(z)
-        cardinality = self.order_by_greedy_metric(
+        ordering = self.elimination_sequence_by_greedy_metric(
             nodes=Zs, s=min_unmarked_neighbours
         )
-        V = {v.id(): v for v in self.V}
-        ordering = [
-            V[n[0]]
-            for n in sorted(list(cardinality.items()), key=lambda x: x[1])
-        ]
         assignments, factors, z_phi = self.max_product_eliminate_vars(
             factors=factors, Zs=ordering
         )
@@ -425,10 +646,7 @@ class PGModel(Graph):
         the model
         """
         assignments, factors, z_phi = self.max_product_ve(evidences=evidences)
-        probs = set()
-        for f in FactorOps.cartesian(z_phi):
-            probs.add(z_phi.phi(f))
-        return max(probs)
+        return max(z_phi.value_table)
 
     def traceback_map(
         self, potentials: List[AbstractFactor], X_is: List[NumCatRVariable]
@@ -443,11 +661,23 @@ class PGModel(Graph):
         let's say g* = argmax(psi(G))
         2. l* = argmax(psi[g*](L))
         3. d* = argmax(psi[l*](D))
+
+        The i-th potential is the factor from which X_is[i] was eliminated,
+        so its maximizing row gives the value of X_is[i]. Picking an
+        arbitrary unassigned variable of that row, as set.pop did, made the
+        result depend on the hash order of variable identifiers. Variables
+        missing from the row are left to the first unassigned one in
+        identifier order.
         """
         max_assignments = {}
         for i in range(len(potentials) - 1, -1, -1):
-            pmax = FactorAnalyzer.max_value(potentials[i])
-            diff = set([p for p in pmax if p[0] not in max_assignments])
-            max_assign = diff.pop()
-            max_assignments[max_assign[0]] = max_assign[1]
+            pmax = dict(FactorAnalyzer.max_value(potentials[i]))
+            var_id = X_is[i].id() if i < len(X_is) else None
+            if var_id not in pmax or var_id in max_assignments:
+                var_id = next(
+                    (v for v in sorted(pmax) if v not in max_assignments),
+                    None,
+                )
+            if var_id is not None:
+                max_assignments[var_id] = pmax[var_id]
         return max_assignments
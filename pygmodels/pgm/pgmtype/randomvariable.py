@@ -3,8 +3,19 @@ Implementation of a random variable
 """
 
 import math
+from itertools import repeat
+from operator import mul
 from random import choice
-from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from uuid import uuid4
 
 from pygmodels.graph.gtype.node import Node
@@ -13,6 +24,13 @@ from pygmodels.value.domain import DomainValue
 from pygmodels.value.value import NumericValue
 
 
+def _identity(x):
+    """!
+    \brief default function of random variables, maps outcomes to themselves
+    """
+    return x
+
+
 class RandomVariable(Node):
     """!
     \brief a Random Variable as defined by Koller, Friedman 2009, p. 20
@@ -36,7 +54,7 @@ class RandomVariable(Node):
         self,
         node_id: str,
         data: Any,
-        f: Callable[[Outcome], CodomainValue] = lambda x: x,
+        f: Callable[[Outcome], CodomainValue] = _identity,
     ):
         """!
         \brief Constructor of a random variable
@@ -63,7 +81,7 @@ class CatRandomVariable(RandomVariable):
         self,
         node_id: str,
         input_data: Dict[str, Any],
-        f: Callable[[Outcome], CodomainValue] = lambda x: x,
+        f: Callable[[Outcome], CodomainValue] = _identity,
         marginal_distribution: Callable[
             [CodomainValue], float
         ] = lambda x: 1.0,
@@ -114,19 +132,37 @@ class CatRandomVariable(RandomVariable):
         data = {}
         data.update(input_data)
         if "possible-outcomes" in input_data:
-            data["outcome-values"] = frozenset(
-                [f(v) for v in input_data["possible-outcomes"].data]
-            )
+            outcomes = input_data["possible-outcomes"].data
+            if f is _identity:
+                data["outcome-values"] = frozenset(outcomes)
+            else:
+                data["outcome-values"] = frozenset(map(f, outcomes))
         super().__init__(node_id=node_id, data=data, f=f)
+        ## probabilities of outcome values evaluated at construction
+        self._probs = {}
+        ## outcome values with aligned tuples of values and probabilities
+        self._outcome_table = None
         if "outcome-values" in data:
-            psum = sum(
-                list(map(marginal_distribution, data["outcome-values"]))
-            )
+            vals = data["outcome-values"]
+            xs = tuple(vals)
+            probs = tuple(map(marginal_distribution, xs))
+            psum = sum(probs)
             if psum > 1 and psum < 0:
                 raise ValueError(
                     "probability sum bigger than 1 or smaller than 0"
                 )
+            self._probs = dict(zip(xs, probs))
+            self._outcome_table = (vals, xs, probs)
         self.dist = marginal_distribution
+        ## outcome values checked by has_negative_value and the result
+        self._negative_check = None
+        ## outcome values used by value_set without arguments and the result
+        self._value_set = None
+        ## outcome values used by _moments and the result
+        self._moments_cache = None
+        ## outcome values used by min_max_marginal_with_outcome and the
+        ## lowest and highest probability-outcome pairs
+        self._extrema = None
 
     def p(self, value: CodomainValue) -> float:
         """!
@@ -137,7 +173,32 @@ class CatRandomVariable(RandomVariable):
 
         \returns probability value associated to the outcome
         """
-        return self.dist(value)
+        try:
+            return self._probs[value]
+        except (KeyError, TypeError):
+            # values outside the table, unhashable ones included, are
+            # passed to the distribution
+            return self.dist(value)
+
+    def p_many(self, values: List[CodomainValue]) -> Tuple[float, ...]:
+        """!
+        \brief probabilities of given outcome values
+
+        Outcome values of the random variable are looked up in the table
+        evaluated at construction, others are passed to the distribution.
+
+        \param values members of \f$\Omega\f$ set of possible outcomes.
+
+        \returns probability values in the order of given values
+        """
+        probs = self._probs
+        dist = self.dist
+        try:
+            return tuple(
+                [probs[v] if v in probs else dist(v) for v in values]
+            )
+        except TypeError:
+            return tuple([self.p(v) for v in values])
 
     def marginal(self, value: CodomainValue) -> float:
         """!
@@ -192,10 +253,39 @@ class CatRandomVariable(RandomVariable):
             )
         return vdata["outcome-values"]
 
+    def outcome_table(
+        self,
+    ) -> Tuple[Tuple[CodomainValue, ...], Tuple[float, ...]]:
+        """!
+        \brief outcome values and their probabilities as two aligned tuples
+
+        The tuples are built once and rebuilt only when the outcome values
+        of the random variable change.
+        """
+        vs = self.values()
+        if self._outcome_table is None or self._outcome_table[0] is not vs:
+            xs = tuple(vs)
+            self._outcome_table = (vs, xs, self.p_many(xs))
+        return self._outcome_table[1], self._outcome_table[2]
+
+    def has_negative_value(self) -> bool:
+        """!
+        \brief check if any of the outcome values is negative
+
+        The result is cached until the outcome values of the random variable
+        are replaced, for example by \see NumCatRVariable.reduce_to_value.
+        Random variables are shared by many factors, so this spares us
+        scanning the same outcome values at each factor construction.
+        """
+        vs = self.values()
+        if self._negative_check is None or self._negative_check[0] is not vs:
+            self._negative_check = (vs, len(vs) > 0 and min(vs) < 0)
+        return self._negative_check[1]
+
     def value_set(
         self,
-        value_filter=lambda x: True,
-        value_transform=lambda x: x,
+        value_filter: Optional[Callable[[NumericValue], bool]] = None,
+        value_transform: Optional[Callable[[NumericValue], Any]] = None,
     ) -> FrozenSet[Tuple[str, NumericValue]]:
         """!
         \brief the outcome value set of the random variable.
@@ -206,6 +296,10 @@ class CatRandomVariable(RandomVariable):
         \param value_transfom function for transforming values during the
         retrieval
 
+        When neither function is given, the value set is cached until the
+        outcome values of the random variable change. Missing functions are
+        not replaced by no-op callables, so they cost nothing per value.
+
         \returns codomain of random variable, that is possible outcomes
         associated to random variable
 
@@ -236,12 +330,21 @@ class CatRandomVariable(RandomVariable):
         \endcode
         """
         sid = self.id()
+        vs = self.values()
+        if value_transform is _identity:
+            value_transform = None
+        if value_filter is None and value_transform is None:
+            if self._value_set is None or self._value_set[0] is not vs:
+                self._value_set = (vs, frozenset([(sid, v) for v in vs]))
+            return self._value_set[1]
+        if value_transform is None:
+            return frozenset(
+                [(sid, v) for v in vs if value_filter(v) is True]
+            )
+        if value_filter is None:
+            return frozenset([(sid, value_transform(v)) for v in vs])
         return frozenset(
-            [
-                (sid, value_transform(v))
-                for v in self.values()
-                if value_filter(v) is True
-            ]
+            [(sid, value_transform(v)) for v in vs if value_filter(v) is True]
         )
 
 
@@ -258,7 +361,7 @@ class NumCatRVariable(CatRandomVariable):
         self,
         node_id: str,
         input_data: Dict[str, Outcome],
-        f: Callable[[Outcome], NumericValue] = lambda x: x,
+        f: Callable[[Outcome], NumericValue] = _identity,
         marginal_distribution: Callable[[NumericValue], float] = lambda x: 1.0,
     ):
         """!
@@ -343,10 +446,10 @@ class NumCatRVariable(CatRandomVariable):
 
         \endcode
         """
-        if isinstance(other, NumCatRVariable) is False:
+        if not isinstance(other, NumCatRVariable):
             raise TypeError(
                 "other arg must be of type NumCatRVariable, it is "
-                + type(other)
+                + type(other).__name__
             )
 
     def has_evidence(self) -> None:
@@ -482,15 +585,19 @@ class NumCatRVariable(CatRandomVariable):
         \param is_min flag for specifying whether to return lowest or highest
         probability-outcome pair
         """
-        mx = float("inf") if is_min else float("-inf")
-        mxv = None
-        for v in self.values():
-            marginal = self.marginal(v)
-            cond = mx > marginal if is_min else mx < marginal
-            if cond:
-                mx = marginal
-                mxv = v
-        return mx, mxv
+        vs = self.values()
+        if self._extrema is None or self._extrema[0] is not vs:
+            xs, ps = self.outcome_table()
+            if len(xs) == 0:
+                lowest = (float("inf"), None)
+                highest = (float("-inf"), None)
+            else:
+                pmin = min(ps)
+                pmax = max(ps)
+                lowest = (pmin, xs[ps.index(pmin)])
+                highest = (pmax, xs[ps.index(pmax)])
+            self._extrema = (vs, lowest, highest)
+        return self._extrema[1] if is_min else self._extrema[2]
 
     def max_marginal_value(self) -> NumericValue:
         """!
@@ -609,8 +716,9 @@ class NumCatRVariable(CatRandomVariable):
         \endcode
         """
         self.type_check(other)
-        marginal = self.marginal(evidence_value)
-        return other.p_x_fn(phi=lambda x: x * marginal)
+        # the marginal is a constant factor of the sum, so the sum reduces to
+        # the expected value of other
+        return self.marginal(evidence_value) * other.expected_value()
 
     def marginal_over_evidence_key(self, other):
         """!
@@ -690,7 +798,45 @@ class NumCatRVariable(CatRandomVariable):
 
         \endcode
         """
-        return sum([value * self.p(value) for value in self.values()])
+        return self._moments()[0]
+
+    def _moments(self) -> Tuple[float, float]:
+        """!
+        \brief first and second moments, \f$ E[X] \f$ and \f$ E[X^2] \f$,
+        computed in a single pass over outcome values
+
+        The result is cached until the outcome values change.
+        """
+        vs = self.values()
+        if self._moments_cache is None or self._moments_cache[0] is not vs:
+            xs, ps = self.outcome_table()
+            s1 = sum(map(mul, xs, ps))
+            s2 = sum(map(mul, map(mul, xs, xs), ps))
+            self._moments_cache = (vs, (s1, s2))
+        return self._moments_cache[1]
+
+    def summary(self) -> Dict[str, Any]:
+        """!
+        \brief summary statistics of the random variable
+
+        \returns a dict with the expected value "E", the variance "Var", the
+        lowest and highest marginals "min_p" and "max_p" and their outcomes
+        "argmin" and "argmax".
+
+        Every entry is read from the per-outcome-values caches, so once they
+        are warm the summary involves no pass over the outcome values.
+        """
+        E_X, E_X2 = self._moments()
+        min_p, argmin = self.min_max_marginal_with_outcome(is_min=True)
+        max_p, argmax = self.min_max_marginal_with_outcome(is_min=False)
+        return {
+            "E": E_X,
+            "Var": E_X2 - (E_X ** 2),
+            "min_p": min_p,
+            "argmin": argmin,
+            "max_p": max_p,
+            "argmax": argmax,
+        }
 
     @staticmethod
     def is_numeric(v: Any) -> bool:
@@ -779,10 +925,7 @@ class NumCatRVariable(CatRandomVariable):
 
         \endcode
         """
-        data = self.data()
-        if "evidence" in data:
-            data.pop("evidence")
-        self.update_data(data)
+        self.data().pop("evidence", None)
 
     def reduce_to_value(self, val: NumericValue):
         """!
@@ -834,8 +977,9 @@ class NumCatRVariable(CatRandomVariable):
 
         \endcode
         """
-        if "evidence" in self.data():
-            return self.marginal(self.data()["evidence"])
+        data = self.data()
+        if "evidence" in data:
+            return self.marginal(data["evidence"])
         return self.expected_value()
 
     def max_marginal_e(self):
@@ -869,8 +1013,9 @@ class NumCatRVariable(CatRandomVariable):
 
         \endcode
         """
-        if "evidence" in self.data():
-            return self.marginal(self.data()["evidence"])
+        data = self.data()
+        if "evidence" in data:
+            return self.marginal(data["evidence"])
         return self.max()
 
     def min_marginal_e(self):
@@ -905,8 +1050,9 @@ class NumCatRVariable(CatRandomVariable):
         \endcode
 
         """
-        if "evidence" in self.data():
-            return self.marginal(self.data()["evidence"])
+        data = self.data()
+        if "evidence" in data:
+            return self.marginal(data["evidence"])
         return self.min()
 
     def p_x_fn(self, phi: Callable[[float], float]):
@@ -916,19 +1062,20 @@ class NumCatRVariable(CatRandomVariable):
         implements:
         \f$\sum_{i=1}^n \phi(x_i) p(x_i) \f$
         """
-        return sum(self.apply(lambda x: phi(x) * self.p(x)))
+        xs, ps = self.outcome_table()
+        return sum(map(mul, map(phi, xs), ps))
 
     def apply(self, phi: Callable[[NumericValue], NumericValue]):
         """!
         \brief apply function phi to possible outcomes of the random variable
         """
-        return [phi(v) for v in self.values()]
+        return list(map(phi, self.values()))
 
     def apply_to_marginals(self, phi: Callable[[float], float]) -> List[float]:
         """!
         \brief apply function phi to marginals of the random variable
         """
-        return self.apply(lambda x: phi(self.marginal(x)))
+        return list(map(phi, self.outcome_table()[1]))
 
     def expected_apply(self, phi: Callable[[NumericValue], NumericValue]):
         """!"""
@@ -939,8 +1086,8 @@ class NumCatRVariable(CatRandomVariable):
         Koller, Friedman 2009, p. 33
         \f$ E[X^2] - (E[X])^2 \f$
         """
-        E_X2 = self.expected_apply(phi=lambda x: x * x)
-        return E_X2 - (self.expected_value() ** 2)
+        E_X, E_X2 = self._moments()
+        return E_X2 - (E_X ** 2)
 
     def standard_deviation(self):
         """!
@@ -975,16 +1122,50 @@ class NumCatRVariable(CatRandomVariable):
         self.type_check(v)
         return self.max_marginal_e() * v.max_marginal_e()
 
+    def joint_matrix_with_index(
+        self, v
+    ) -> Tuple[
+        Tuple[NumericValue, ...],
+        Tuple[NumericValue, ...],
+        Tuple[Tuple[float, ...], ...],
+    ]:
+        """!
+        \brief joint probabilities of all outcome pairs of two random
+        variables with the outcomes indexing rows and columns
+
+        Row i and column j of the matrix holds \f$ p(x_i) p(y_j) \f$ where
+        \f$ x_i \f$ is the ith outcome of this random variable and
+        \f$ y_j \f$ is the jth outcome of v.
+        """
+        self.type_check(v)
+        xs, ps = self.outcome_table()
+        ys, qs = v.outcome_table()
+        matrix = tuple(tuple(map(mul, repeat(p), qs)) for p in ps)
+        return xs, ys, matrix
+
+    def joint_matrix(self, v) -> Tuple[Tuple[float, ...], ...]:
+        """!
+        \brief joint probabilities of all outcome pairs of two random
+        variables, see joint_matrix_with_index for the ordering of outcomes
+        """
+        return self.joint_matrix_with_index(v)[2]
+
     def conditional(self, other):
         """!
         Conditional probability distribution (Bayes rule)
         from Koller and Friedman
+
+        The joint is the product of the marginals, see joint, so the marginal
+        of other cancels out of \f$ P(X, Y) / P(Y) \f$ and the conditional
+        is \f$ P(X) \f$.
         """
         self.type_check(other)
-        return self.joint(other) / other.P_X_e()
+        return self.P_X_e()
 
     def max_conditional(self, other):
         """!"""
         self.type_check(other)
-        joint = self.max_joint(other)
-        return max([v for v in other.apply_to_marginals(lambda x: joint / x)])
+        joint = self.max_marginal_e() * other.max_marginal_e()
+        # joint and marginals are probabilities, so the largest ratio is
+        # obtained with the smallest marginal
+        return joint / min(other.outcome_table()[1])
@@ -7,6 +7,8 @@ from typing import Any
 
 
 class AbstractSetValue:
+    __slots__ = ()
+
     @abstractmethod
     def belongs_to(self) -> str:
         "The name of the set that contains the value"
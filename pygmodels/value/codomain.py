@@ -10,6 +10,8 @@ from pygmodels.value.value import SetValue
 
 
 class Outcome:
+    __slots__ = ("data",)
+
     def __init__(self, v):
         self.data = v
 
@@ -30,5 +32,7 @@ class PossibleOutcomes:
     this object are measurable.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, omega: FrozenSet[Outcome]):
         self.data = omega
@@ -8,6 +8,8 @@ from pygmodels.value.abstractvalue import AbstractSetValue
 
 
 class DomainValue(AbstractSetValue):
+    __slots__ = ("v", "_domain")
+
     def __init__(self, v: Any, dom_id: Optional[str]):
         self.v = v
         self._domain = dom_id
@@ -18,6 +18,8 @@ Value = Union[
 class SetValue(AbstractSetValue):
     "Value contained by a set"
 
+    __slots__ = ("v", "_set")
+
     def __init__(self, v: Optional[Value], set_id: Optional[str] = None):
         if v is None:
             val = None
@@ -56,6 +56,12 @@ class BaseGraphTest(unittest.TestCase):
             self.assertEqual(nid in V, nid in nodes)
             self.assertEqual(V[nid], nodes[nid])
 
+    def test_gdata(self):
+        """"""
+        g = BaseGraph("g2", nodes=set([self.n5]), edges=set([self.e1]))
+        self.assertEqual(g.V, frozenset([self.n1, self.n2, self.n5]))
+        self.assertEqual(g.gdata, {"n1": ["e1"], "n2": ["e1"], "n5": []})
+
     def test_E(self):
         """"""
         E = {e.id(): e for e in self.graph.E}
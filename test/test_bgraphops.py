@@ -167,8 +167,8 @@ class BaseGraphOpsTest(unittest.TestCase):
         self.ugraph4 = BaseGraph(
             "ug4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.ugraph2.V).union(self.graph_2.V),
-            edges=set(self.ugraph2.E).union(self.graph_2.E),
+            nodes=self.ugraph2.V | self.graph_2.V,
+            edges=self.ugraph2.E | self.graph_2.E,
         )
         # ugraph 4
         #   +-----+     n1 -- n2 -- n3 -- n4
@@ -338,6 +338,13 @@ class BaseGraphOpsTest(unittest.TestCase):
             },
         )
 
+    def test_adjmat_bits(self):
+        """"""
+        index, rows = BaseGraphOps.to_adjmat_bits(self.ugraph1)
+        mat = BaseGraphOps.to_adjmat(self.ugraph1, vtype=bool)
+        for (v, k), flag in mat.items():
+            self.assertEqual(bool(rows[index[v]] >> index[k] & 1), flag)
+
     def test_is_adjacent_of(self):
         self.assertTrue(
             BaseGraphBoolOps.is_adjacent_of(self.graph_2, self.e2, self.e3)
@@ -383,6 +390,12 @@ class BaseGraphOpsTest(unittest.TestCase):
         )
         self.assertEqual(ndes, set([self.n1.id(), self.n3.id()]))
 
+    def test_adjacency_view(self):
+        view = BaseGraphNodeOps.adjacency_view(self.graph_2)
+        self.assertEqual(view["n2"], frozenset(["n1", "n3"]))
+        self.assertIs(BaseGraphNodeOps.adjacency_view(self.graph_2), view)
+        self.assertIs(self.graph_2._adjacency[3], view)
+
 
 if __name__ == "__main__":
     unittest.main()
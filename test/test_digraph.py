@@ -2,7 +2,6 @@
 Test directed graph object
 """
 import pdb
-import pprint
 import unittest
 
 from pygmodels.graph.gmodel.digraph import DiGraph
@@ -18,64 +17,73 @@ from pygmodels.graph.gtype.node import Node
 class DiGraphTest(unittest.TestCase):
     """!"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         #
-        self.n1 = Node("n1", {})
-        self.n2 = Node("n2", {})
-        self.n3 = Node("n3", {})
-        self.n4 = Node("n4", {})
-        self.n5 = Node("n5", {})
-        self.e1 = Edge.directed("e1", start_node=self.n1, end_node=self.n2)
-        self.e2 = Edge.directed("e2", start_node=self.n2, end_node=self.n3)
-        self.e3 = Edge.directed("e3", start_node=self.n3, end_node=self.n4)
-        self.e4 = Edge.directed("e4", start_node=self.n1, end_node=self.n4)
-        self.graph_2 = DiGraph(
+        cls.n1 = Node("n1", {})
+        cls.n2 = Node("n2", {})
+        cls.n3 = Node("n3", {})
+        cls.n4 = Node("n4", {})
+        cls.n5 = Node("n5", {})
+        for eid, start, end in [
+            ("e1", cls.n1, cls.n2),
+            ("e2", cls.n2, cls.n3),
+            ("e3", cls.n3, cls.n4),
+            ("e4", cls.n1, cls.n4),
+        ]:
+            edge = Edge.directed(eid, start_node=start, end_node=end)
+            setattr(cls, eid, edge)
+        cls.graph_2 = DiGraph(
             "g2",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.n1, self.n2, self.n3, self.n4]),
-            edges=set([self.e1, self.e2, self.e3, self.e4]),
+            nodes=frozenset([cls.n1, cls.n2, cls.n3, cls.n4]),
+            edges=frozenset([cls.e1, cls.e2, cls.e3, cls.e4]),
         )
         #
         # n1 → n2 → n3 → n4
         # |              ↑
         # +--------------+
 
-        self.a = Node("a", {})  # b
-        self.b = Node("b", {})  # c
-        self.c = Node("c", {})
-        self.d = Node("d", {})
-        self.f = Node("f", {})  # d
-        self.e = Node("e", {})  # e
-        self.g = Node("g", {})
-        self.h = Node("h", {})
-        self.ae = Edge.directed("ae", start_node=self.a, end_node=self.e)
-        self.ab = Edge.directed("ab", start_node=self.a, end_node=self.b)
-        self.af = Edge.directed("af", start_node=self.a, end_node=self.f)
-        self.ah = Edge.directed("ah", start_node=self.a, end_node=self.h)
-        self.bh = Edge.directed("bh", start_node=self.b, end_node=self.h)
-        self.be = Edge.directed("be", start_node=self.b, end_node=self.e)
-        self.ef = Edge.directed("ef", start_node=self.e, end_node=self.f)
-        self.de = Edge.directed("de", start_node=self.d, end_node=self.e)
-        self.df = Edge.directed("df", start_node=self.d, end_node=self.f)
-        self.cd = Edge.directed("cd", start_node=self.c, end_node=self.d)
-        self.cg = Edge.directed("cg", start_node=self.c, end_node=self.g)
-        self.gd = Edge.directed("gd", start_node=self.g, end_node=self.d)
-        self.bg = Edge.directed("bg", start_node=self.b, end_node=self.g)
-        self.fg = Edge.directed("fg", start_node=self.f, end_node=self.g)
-        self.bc = Edge.directed("bc", start_node=self.b, end_node=self.c)
+        cls.a = Node("a", {})  # b
+        cls.b = Node("b", {})  # c
+        cls.c = Node("c", {})
+        cls.d = Node("d", {})
+        cls.f = Node("f", {})  # d
+        cls.e = Node("e", {})  # e
+        cls.g = Node("g", {})
+        cls.h = Node("h", {})
+        for eid, start, end in [
+            ("ae", cls.a, cls.e),
+            ("ab", cls.a, cls.b),
+            ("af", cls.a, cls.f),
+            ("ah", cls.a, cls.h),
+            ("bh", cls.b, cls.h),
+            ("be", cls.b, cls.e),
+            ("ef", cls.e, cls.f),
+            ("de", cls.d, cls.e),
+            ("df", cls.d, cls.f),
+            ("cd", cls.c, cls.d),
+            ("cg", cls.c, cls.g),
+            ("gd", cls.g, cls.d),
+            ("bg", cls.b, cls.g),
+            ("fg", cls.f, cls.g),
+            ("bc", cls.b, cls.c),
+        ]:
+            edge = Edge.directed(eid, start_node=start, end_node=end)
+            setattr(cls, eid, edge)
 
         # directed graph
-        self.dgraph1 = DiGraph(
+        cls.dgraph1 = DiGraph(
             "dg1",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ae,
-                    # self.ab,
-                    self.af,
-                    # self.be,
-                    self.ef,
+                    cls.ae,
+                    # cls.ab,
+                    cls.af,
+                    # cls.be,
+                    cls.ef,
                 ]
             ),
         )
@@ -87,17 +95,17 @@ class DiGraphTest(unittest.TestCase):
         # +---> f <---+
         #
 
-        self.dgraph2 = DiGraph(
+        cls.dgraph2 = DiGraph(
             "dg2",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ae,
-                    self.ab,
-                    self.af,
-                    self.be,
-                    self.ef,
+                    cls.ae,
+                    cls.ab,
+                    cls.af,
+                    cls.be,
+                    cls.ef,
                 ]
             ),
         )
@@ -107,15 +115,15 @@ class DiGraphTest(unittest.TestCase):
         # |         ↑    ↑
         # +---------+----+
 
-        self.dgraph3 = DiGraph(
+        cls.dgraph3 = DiGraph(
             "dg3",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ab,
-                    self.af,
-                    self.be,
+                    cls.ab,
+                    cls.af,
+                    cls.be,
                 ]
             ),
         )
@@ -125,11 +133,11 @@ class DiGraphTest(unittest.TestCase):
         #  \
         #   +---> f
 
-        self.dgraph4 = DiGraph(
+        cls.dgraph4 = DiGraph(
             "dg4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.dgraph2.V).union(set(self.graph_2.V)),
-            edges=set(self.dgraph2.E).union(set(self.graph_2.E)),
+            nodes=cls.dgraph2.V | cls.graph_2.V,
+            edges=cls.dgraph2.E | cls.graph_2.E,
         )
         # dgraph 4
         #
@@ -137,24 +145,24 @@ class DiGraphTest(unittest.TestCase):
         # |         ↑    ↑   |                  ↑
         # +---------+----+   +------------------+
 
-        self.e_n = Edge.directed("en", start_node=self.e, end_node=self.n1)
+        cls.e_n = Edge.directed("en", start_node=cls.e, end_node=cls.n1)
 
-        self.dgraph5 = DiGraph(
+        cls.dgraph5 = DiGraph(
             "dg5",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(
-                [self.a, self.b, self.c, self.d, self.e, self.f, self.g]
+            nodes=frozenset(
+                [cls.a, cls.b, cls.c, cls.d, cls.e, cls.f, cls.g]
             ),
-            edges=set(
+            edges=frozenset(
                 [
-                    self.ab,
-                    self.bc,
-                    self.bg,
-                    self.cd,
-                    self.gd,
-                    self.df,
-                    self.de,
-                    self.ef,
+                    cls.ab,
+                    cls.bc,
+                    cls.bg,
+                    cls.cd,
+                    cls.gd,
+                    cls.df,
+                    cls.de,
+                    cls.ef,
                 ]
             ),
         )
@@ -165,32 +173,32 @@ class DiGraphTest(unittest.TestCase):
         #       \      /      \      v
         #        +--> g        +---> f
 
-        self.dgraph6 = DiGraph(
+        cls.dgraph6 = DiGraph(
             "dg6",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(
+            nodes=frozenset(
                 [
-                    self.a,
-                    self.b,
-                    self.c,
-                    self.d,
-                    self.e,
-                    self.f,
-                    self.g,
-                    self.h,
+                    cls.a,
+                    cls.b,
+                    cls.c,
+                    cls.d,
+                    cls.e,
+                    cls.f,
+                    cls.g,
+                    cls.h,
                 ]
             ),
-            edges=set(
+            edges=frozenset(
                 [
-                    self.ab,
-                    self.ah,
-                    self.bc,
-                    self.bh,
-                    self.cd,
-                    self.de,
-                    self.df,
-                    self.cg,
-                    self.fg,
+                    cls.ab,
+                    cls.ah,
+                    cls.bc,
+                    cls.bh,
+                    cls.cd,
+                    cls.de,
+                    cls.df,
+                    cls.cg,
+                    cls.fg,
                 ]
             ),
         )
@@ -220,6 +228,17 @@ class DiGraphTest(unittest.TestCase):
         v = self.dgraph4.check_for_path(self.n1, self.n2)
         self.assertTrue(v)
 
+    def test_check_for_path_reverse(self):
+        v = self.dgraph4.check_for_path(self.n2, self.n1)
+        self.assertFalse(v)
+
+    def test_lazy_props(self):
+        g = DiGraph("g", nodes=set([self.n1, self.n2]), edges=set([self.e1]))
+        self.assertIsNone(g._path_props)
+        self.assertIsNone(g._dprops)
+        self.assertEqual(set(g.path_props.keys()), set(["n1", "n2"]))
+        self.assertEqual(g.dprops.nb_component, 1)
+
     def test_outgoing_edges_of_1(self):
         """"""
         out_edges1 = BaseGraphEdgeOps.outgoing_edges_of(self.graph_2, self.n1)
@@ -244,6 +263,27 @@ class DiGraphTest(unittest.TestCase):
         comp2 = frozenset([self.e1])
         self.assertEqual(out_edges2, comp2)
 
+    def test_incidence_maps(self):
+        """"""
+        out_map, in_map = BaseGraphEdgeOps.incidence_maps(self.graph_2)
+        self.assertEqual(set(out_map["n1"]), set([self.e1, self.e4]))
+        self.assertEqual(in_map["n1"], ())
+        self.assertEqual(in_map["n2"], (self.e1,))
+        self.assertIs(
+            BaseGraphEdgeOps.incidence_maps(self.graph_2)[0], out_map
+        )
+
+    def test_outgoing_edges_of_node_data_update(self):
+        """"""
+        a = Node("a", {})
+        b = Node("b", {})
+        ab = Edge.directed("ab", start_node=a, end_node=b)
+        g = DiGraph("g", nodes=frozenset([a, b]), edges=frozenset([ab]))
+        self.assertIn(ab, BaseGraphEdgeOps.outgoing_edges_of(g, a))
+        a.update_data({"color": "red"})
+        self.assertIn(ab, BaseGraphEdgeOps.outgoing_edges_of(g, a))
+        self.assertIn(ab, BaseGraphEdgeOps.incoming_edges_of(g, b))
+
     @unittest.skip("Reference found but not implemented yet")
     def test_find_transitive_closure(self):
         "Nuutila 1995 p. 14 - 15"
@@ -139,8 +139,8 @@ class DiGraphOpsTest(unittest.TestCase):
         self.dgraph4 = DiGraph(
             "dg4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.dgraph2.V).union(set(self.graph_2.V)),
-            edges=set(self.dgraph2.E).union(set(self.graph_2.E)),
+            nodes=self.dgraph2.V | self.graph_2.V,
+            edges=self.dgraph2.E | self.graph_2.E,
         )
         # dgraph 4
         #
@@ -1,6 +1,7 @@
 """!
 Edge unit tests
 """
+import sys
 import unittest
 
 from pygmodels.graph.gtype.edge import Edge, EdgeType
@@ -33,6 +34,12 @@ class EdgeTest(unittest.TestCase):
         """"""
         self.assertEqual(self.uedge.id(), "uedge")
 
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "abc.ABC has no __slots__ before 3.7"
+    )
+    def test_slots(self):
+        self.assertFalse(hasattr(self.dedge, "__dict__"))
+
     def test_type(self):
         """"""
         self.assertEqual(self.uedge.type(), EdgeType.UNDIRECTED)
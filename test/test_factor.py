@@ -2,6 +2,7 @@
 test for factor.py
 """
 import math
+import sys
 import unittest
 from random import choice
 
@@ -243,6 +244,49 @@ class TestFactor(unittest.TestCase):
         """"""
         self.assertEqual(self.f.id(), "f")
 
+    def test_equal(self):
+        """"""
+        AB = Factor(
+            gid="AB2",
+            scope_vars=set([self.Af, self.Bf]),
+            factor_fn=self.AB.factor_fn,
+        )
+        self.assertEqual(self.AB, AB)
+        self.assertEqual(self.AB.fingerprint, AB.fingerprint)
+
+    def test_not_equal(self):
+        """"""
+        AB = Factor(
+            gid="AB2",
+            scope_vars=set([self.Af, self.Bf]),
+            factor_fn=lambda x: 1.0,
+        )
+        self.assertNotEqual(self.AB, AB)
+
+    def test_data_not_shared(self):
+        """"""
+        f1 = Factor(gid="f1", scope_vars=set([self.Af]))
+        f2 = Factor(gid="f2", scope_vars=set([self.Af]))
+        f1.update_data({"foo": "bar"})
+        self.assertEqual(f2.data(), {})
+
+    def test_scope_vars_frozen(self):
+        """"""
+        svars = set([self.Af])
+        f = Factor(gid="f", scope_vars=svars)
+        svars.add(self.Bf)
+        self.assertEqual(f.scope_vars(), frozenset([self.Af]))
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "abc.ABC has no __slots__ before 3.7"
+    )
+    def test_slots(self):
+        """"""
+        f = Factor(gid="f", scope_vars=set([self.Af]))
+        self.assertFalse(hasattr(f, "__dict__"))
+        with self.assertRaises(AttributeError):
+            f.foo = "bar"
+
     def test_domain_scope(self):
         """"""
         d = FactorOps.domain_scope(
@@ -260,6 +304,12 @@ class TestFactor(unittest.TestCase):
         self.assertFalse(nottuple[0])
         self.assertEqual(nottuple[1], None)
 
+    def test_find_scope_var(self):
+        """"""
+        self.assertEqual(self.f.find_scope_var("dice"), self.dice)
+        self.assertIsNone(self.f.find_scope_var("dice22"))
+        self.assertEqual(self.f.var_names, tuple(sorted(self.f.var_names)))
+
     def test_has_var(self):
         """"""
         intuple = FactorBoolOps.has_var(self.f, ids="dice")
@@ -305,6 +355,75 @@ class TestFactor(unittest.TestCase):
         )
         self.assertTrue(pval, 1.0)
 
+    def test_partition_value_duplicated_domain(self):
+        """"""
+        x = NumCatRVariable(
+            node_id="x",
+            input_data={"outcome-values": [1, 2]},
+            marginal_distribution=lambda v: 0.5,
+        )
+        y = NumCatRVariable(
+            node_id="y",
+            input_data={"outcome-values": [1, 2, 3]},
+            marginal_distribution=lambda v: 1 / 3,
+        )
+
+        def phi_xy(scope_product):
+            """"""
+            res = 1
+            for _, v in scope_product:
+                res *= v
+            return res
+
+        f = Factor(gid="xy", scope_vars=set([x, y]), factor_fn=phi_xy)
+        dx = x.value_set()
+        self.assertEqual(f.Z, 18)
+        self.assertEqual(f.partition_value([dx, dx]), 9)
+
+    def test_z(self):
+        """"""
+        pval = self.f.partition_value(
+            FactorOps.factor_domain(self.f, D=self.f.scope_vars())
+        )
+        self.assertEqual(self.f.Z, pval)
+
+    def test_z_marginal_joint(self):
+        """"""
+        pval = sum(self.f.phi(sp) for sp in self.f.scope_products)
+        self.assertEqual(round(self.f.Z, 6), round(pval, 6))
+
+    def test_scope_products(self):
+        """"""
+        self.assertEqual(len(self.f.scope_products), 2 * 3 * 6)
+
+    def test_value_matrix(self):
+        """"""
+        names = self.f.var_names
+        for i, row in enumerate(self.f.value_matrix):
+            self.assertEqual(
+                frozenset(zip(names, row)),
+                frozenset(self.f.scope_products[i]),
+            )
+
+    def test_phi_row(self):
+        """"""
+        self.assertEqual(
+            round(self.f.phi_row(0), 6),
+            round(self.f.phi(self.f.scope_products[0]), 6),
+        )
+
+    def test_value_table(self):
+        """"""
+        table = self.f.value_table
+        self.assertEqual(len(table), len(self.f.value_matrix))
+        self.assertEqual(round(sum(table), 6), round(self.f.Z, 6))
+
+    def test_value_table_marginal_joint(self):
+        """"""
+        table = self.f.value_table
+        for i in range(len(table)):
+            self.assertAlmostEqual(table[i], self.f.phi(self.f._row_to_set(i)))
+
     def test_phi(self):
         """"""
         mjoint = self.f.phi(set([("int", 0.1), ("grade", 0.4), ("dice", 2)]))
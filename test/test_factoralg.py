@@ -1,13 +1,18 @@
 """!
 Factor algebra test cases
 """
+import gc
 import math
 import unittest
+import weakref
 from random import choice
 
 from pygmodels.factor.factor import BaseFactor, Factor
 from pygmodels.factor.factorf.factoralg import FactorAlgebra
-from pygmodels.factor.factorf.factorops import FactorOps
+from pygmodels.factor.factorf.factorops import (
+    FactorFactorableOps,
+    FactorOps,
+)
 from pygmodels.graph.gtype.edge import Edge, EdgeType
 from pygmodels.pgm.pgmtype.randomvariable import NumCatRVariable
 
@@ -254,6 +259,45 @@ class TestFactorAlg(unittest.TestCase):
                 self.assertEqual(f, 300000)
                 self.assertEqual(ff, 0.041656)
 
+    def test_factor_product_memoized(self):
+        """"""
+        AB_BC, prod = FactorAlgebra.product(f=self.AB, other=self.BC)
+        AB_BC_2, prod2 = FactorAlgebra.product(f=self.AB, other=self.BC)
+        self.assertIs(AB_BC, AB_BC_2)
+        FactorAlgebra.clear_cache()
+        AB_BC_3, prod3 = FactorAlgebra.product(f=self.AB, other=self.BC)
+        self.assertIsNot(AB_BC, AB_BC_3)
+        self.assertEqual(prod, prod3)
+
+    def test_factor_product_memoized_custom_fn(self):
+        """"""
+        AB_BC, prod = FactorAlgebra.product(
+            f=self.AB, other=self.BC, product_fn=lambda x, y: x * y
+        )
+        AB_BC_2, prod2 = FactorAlgebra.product(
+            f=self.AB, other=self.BC, product_fn=lambda x, y: x * y
+        )
+        self.assertIsNot(AB_BC, AB_BC_2)
+        self.assertEqual(prod, prod2)
+
+    def test_factor_product_memoized_released(self):
+        """"""
+        f = Factor(
+            gid="f",
+            scope_vars=set([self.Af, self.Bf]),
+            factor_fn=self.AB.factor_fn,
+        )
+        other = Factor(
+            gid="other",
+            scope_vars=set([self.Bf, self.Cf]),
+            factor_fn=self.BC.factor_fn,
+        )
+        result, prod = FactorAlgebra.product(f=f, other=other)
+        refs = [weakref.ref(f), weakref.ref(other), weakref.ref(result)]
+        del f, other, result
+        gc.collect()
+        self.assertEqual([r() for r in refs], [None, None, None])
+
     def test_reduced_by_value(self):
         "from Koller, Friedman 2009, p. 111 figure 4.5"
         red = set([("C", 10)])
@@ -335,6 +379,35 @@ class TestFactorAlg(unittest.TestCase):
             elif diff == set([("C", 50), ("A", 20)]):
                 self.assertEqual(f, 0.39)
 
+    def test_products(self):
+        """"""
+        fs = [self.AB, self.BC, self.CD]
+        prods, pval = FactorAlgebra.products(fs)
+        ab_bc, v = FactorAlgebra.product(f=self.AB, other=self.BC)
+        ab_bc_cd, fval = FactorAlgebra.product(f=ab_bc, other=self.CD)
+        self.assertEqual(prods.scope_vars(), ab_bc_cd.scope_vars())
+        for p in FactorOps.cartesian(prods):
+            self.assertEqual(prods.phi(p), ab_bc_cd.phi(p))
+        self.assertAlmostEqual(pval / fval, 1.0)
+
+    def test_sumout_vars(self):
+        """"""
+        aB_c, prod = FactorAlgebra.product(f=self.aB, other=self.bc)
+        c = FactorAlgebra.sumout_vars(aB_c, set([self.Bf, self.af]))
+        a_c = FactorAlgebra.sumout_var(aB_c, self.Bf)
+        c_chain = FactorAlgebra.sumout_var(a_c, self.af)
+        for p in FactorOps.cartesian(c):
+            self.assertEqual(round(c.phi(p), 4), round(c_chain.phi(p), 4))
+
+    def test_tabulate_out(self):
+        """"""
+        aB_c, prod = FactorAlgebra.product(f=self.aB, other=self.bc)
+        table = FactorFactorableOps.tabulate_out(aB_c, set([self.Bf]), max)
+        a_c = FactorAlgebra.maxout_var(aB_c, self.Bf)
+        self.assertEqual(len(table), 6)
+        for p in FactorOps.cartesian(a_c):
+            self.assertEqual(table[frozenset(p)], a_c.phi(p))
+
     def test_maxout_var(self):
         "from Koller, Friedman 2009, p. 555 figure 13.1"
         aB_c, prod = FactorAlgebra.product(f=self.aB, other=self.bc)
@@ -72,10 +72,15 @@ class TestFactorAnalyzer(unittest.TestCase):
         mval = FactorNumericAnalyzer.min_probability(self.bc)
         self.assertEqual(mval, 0.1)
 
-    @unittest.skip("FactorAnalyzer.normalize not yet implemented")
     def test_normalize(self):
         """"""
-        pass
+        nval = FactorNumericAnalyzer.normalize(self.bc, 0.7)
+        self.assertEqual(round(nval, 4), round(0.7 / 1.5, 4))
+
+    def test_zval(self):
+        """"""
+        zval = FactorNumericAnalyzer.zval(self.bc)
+        self.assertEqual(round(zval, 4), 1.5)
 
 
 if __name__ == "__main__":
@@ -27,98 +27,72 @@ from pygmodels.graph.gtype.node import Node
 class GraphTest(unittest.TestCase):
     """"""
 
-    def setUp(self):
-        self.verbose = False
-        self.n1 = Node("n1", {})
-        self.n2 = Node("n2", {})
-        self.n3 = Node("n3", {})
-        self.n4 = Node("n4", {})
-        self.n5 = Node("n5", {})
-        self.e1 = Edge(
-            "e1",
-            start_node=self.n1,
-            end_node=self.n2,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.e2 = Edge(
-            "e2",
-            start_node=self.n2,
-            end_node=self.n3,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.e3 = Edge(
-            "e3",
-            start_node=self.n3,
-            end_node=self.n4,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.e4 = Edge(
-            "e4",
-            start_node=self.n1,
-            end_node=self.n4,
-            edge_type=EdgeType.UNDIRECTED,
-        )
+    @classmethod
+    def setUpClass(cls):
+        cls.verbose = False
+        cls.n1 = Node("n1", {})
+        cls.n2 = Node("n2", {})
+        cls.n3 = Node("n3", {})
+        cls.n4 = Node("n4", {})
+        cls.n5 = Node("n5", {})
+        for eid, start, end in [
+            ("e1", cls.n1, cls.n2),
+            ("e2", cls.n2, cls.n3),
+            ("e3", cls.n3, cls.n4),
+            ("e4", cls.n1, cls.n4),
+        ]:
+            edge = Edge(
+                eid,
+                start_node=start,
+                end_node=end,
+                edge_type=EdgeType.UNDIRECTED,
+            )
+            setattr(cls, eid, edge)
 
-        self.graph = Graph(
+        cls.graph = Graph(
             "g1",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.n1, self.n2, self.n3, self.n4]),
-            edges=set([self.e1, self.e2]),
+            nodes=frozenset([cls.n1, cls.n2, cls.n3, cls.n4]),
+            edges=frozenset([cls.e1, cls.e2]),
         )
-        self.graph_2 = Graph(
+        cls.graph_2 = Graph(
             "g2",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.n1, self.n2, self.n3, self.n4]),
-            edges=set([self.e1, self.e2, self.e3]),
+            nodes=frozenset([cls.n1, cls.n2, cls.n3, cls.n4]),
+            edges=frozenset([cls.e1, cls.e2, cls.e3]),
         )
         #
-        self.a = Node("a", {})  # b
-        self.b = Node("b", {})  # c
-        self.f = Node("f", {})  # d
-        self.e = Node("e", {})  # e
-        self.ae = Edge(
-            "ae",
-            start_node=self.a,
-            end_node=self.e,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.ab = Edge(
-            "ab",
-            start_node=self.a,
-            end_node=self.b,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.af = Edge(
-            "af",
-            start_node=self.a,
-            end_node=self.f,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.be = Edge(
-            "be",
-            start_node=self.b,
-            end_node=self.e,
-            edge_type=EdgeType.UNDIRECTED,
-        )
-        self.ef = Edge(
-            "ef",
-            start_node=self.e,
-            end_node=self.f,
-            edge_type=EdgeType.UNDIRECTED,
-        )
+        cls.a = Node("a", {})  # b
+        cls.b = Node("b", {})  # c
+        cls.f = Node("f", {})  # d
+        cls.e = Node("e", {})  # e
+        for eid, start, end in [
+            ("ae", cls.a, cls.e),
+            ("ab", cls.a, cls.b),
+            ("af", cls.a, cls.f),
+            ("be", cls.b, cls.e),
+            ("ef", cls.e, cls.f),
+        ]:
+            edge = Edge(
+                eid,
+                start_node=start,
+                end_node=end,
+                edge_type=EdgeType.UNDIRECTED,
+            )
+            setattr(cls, eid, edge)
 
         # undirected graph
-        self.ugraph1 = Graph(
+        cls.ugraph1 = Graph(
             "ug1",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ae,
-                    # self.ab,
-                    self.af,
-                    # self.be,
-                    self.ef,
+                    cls.ae,
+                    # cls.ab,
+                    cls.af,
+                    # cls.be,
+                    cls.ef,
                 ]
             ),
         )
@@ -129,17 +103,17 @@ class GraphTest(unittest.TestCase):
         #  \       /
         #   +-----f
 
-        self.ugraph2 = Graph(
+        cls.ugraph2 = Graph(
             "ug2",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ae,
-                    self.ab,
-                    self.af,
-                    self.be,
-                    self.ef,
+                    cls.ae,
+                    cls.ab,
+                    cls.af,
+                    cls.be,
+                    cls.ef,
                 ]
             ),
         )
@@ -150,15 +124,15 @@ class GraphTest(unittest.TestCase):
         #  \       /
         #   +-----f
 
-        self.ugraph3 = Graph(
+        cls.ugraph3 = Graph(
             "ug3",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.a, self.b, self.e, self.f]),
-            edges=set(
+            nodes=frozenset([cls.a, cls.b, cls.e, cls.f]),
+            edges=frozenset(
                 [
-                    self.ab,
-                    # self.af,
-                    self.be,
+                    cls.ab,
+                    # cls.af,
+                    cls.be,
                 ]
             ),
         )
@@ -169,32 +143,32 @@ class GraphTest(unittest.TestCase):
         #  \
         #   +-----f
 
-        self.ugraph4 = Graph(
+        cls.ugraph4 = Graph(
             "ug4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(
+            nodes=frozenset(
                 [
-                    self.a,
-                    self.b,
-                    self.e,
-                    self.f,
-                    self.n1,
-                    self.n2,
-                    self.n3,
-                    self.n4,
+                    cls.a,
+                    cls.b,
+                    cls.e,
+                    cls.f,
+                    cls.n1,
+                    cls.n2,
+                    cls.n3,
+                    cls.n4,
                 ]
             ),
-            edges=set(
+            edges=frozenset(
                 [
-                    self.ab,
-                    self.af,
-                    self.ae,
-                    self.be,
-                    self.ef,
-                    self.e1,
-                    self.e2,
-                    self.e3,
-                    self.e4,
+                    cls.ab,
+                    cls.af,
+                    cls.ae,
+                    cls.be,
+                    cls.ef,
+                    cls.e1,
+                    cls.e2,
+                    cls.e3,
+                    cls.e4,
                 ]
             ),
         )
@@ -206,50 +180,35 @@ class GraphTest(unittest.TestCase):
         #   +-----f
 
         # make some directed edges
-        self.bb = Node("bb", {})
-        self.cc = Node("cc", {})
-        self.dd = Node("dd", {})
-        self.ee = Node("ee", {})
+        cls.bb = Node("bb", {})
+        cls.cc = Node("cc", {})
+        cls.dd = Node("dd", {})
+        cls.ee = Node("ee", {})
 
-        self.bb_cc = Edge(
-            "bb_cc",
-            start_node=self.bb,
-            end_node=self.cc,
-            edge_type=EdgeType.DIRECTED,
-        )
-        self.cc_dd = Edge(
-            "cc_dd",
-            start_node=self.cc,
-            end_node=self.dd,
-            edge_type=EdgeType.DIRECTED,
-        )
-        self.dd_ee = Edge(
-            "dd_ee",
-            start_node=self.dd,
-            end_node=self.ee,
-            edge_type=EdgeType.DIRECTED,
-        )
-        self.ee_bb = Edge(
-            "ee_bb",
-            start_node=self.ee,
-            end_node=self.bb,
-            edge_type=EdgeType.DIRECTED,
-        )
-        self.bb_dd = Edge(
-            "bb_dd",
-            start_node=self.bb,
-            end_node=self.dd,
-            edge_type=EdgeType.DIRECTED,
-        )
-        self.dgraph = Graph(
+        for eid, start, end in [
+            ("bb_cc", cls.bb, cls.cc),
+            ("cc_dd", cls.cc, cls.dd),
+            ("dd_ee", cls.dd, cls.ee),
+            ("ee_bb", cls.ee, cls.bb),
+            ("bb_dd", cls.bb, cls.dd),
+        ]:
+            edge = Edge(
+                eid,
+                start_node=start,
+                end_node=end,
+                edge_type=EdgeType.DIRECTED,
+            )
+            setattr(cls, eid, edge)
+        cls.dgraph = Graph(
             "g1",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set([self.bb, self.cc, self.dd, self.ee]),
-            edges=set(
-                [self.bb_cc, self.cc_dd, self.dd_ee, self.ee_bb, self.bb_dd]
+            nodes=frozenset([cls.bb, cls.cc, cls.dd, cls.ee]),
+            edges=frozenset(
+                [cls.bb_cc, cls.cc_dd, cls.dd_ee, cls.ee_bb, cls.bb_dd]
             ),
         )
 
+    def setUp(self):
         # initialize profiler
         self.prof = cProfile.Profile()
         self.prof.enable()
@@ -368,6 +327,30 @@ class GraphTest(unittest.TestCase):
         c3 = BaseGraphBoolAnalyzer.has_cycles(self.ugraph2)
         self.assertTrue(c3)
 
+    def test_has_cycles_with_pendant_vertex(self):
+        "a cycle is found even if the minimum degree is below 2"
+        g = Graph(
+            "g",
+            data={},
+            nodes=set([self.a, self.b, self.e, self.f]),
+            edges=set([self.ae, self.af, self.ef, self.ab]),
+        )
+        self.assertTrue(BaseGraphBoolAnalyzer.has_cycles(g))
+        self.assertTrue(BaseGraphBoolAnalyzer.has_cycles(self.ugraph1))
+
+    def test_shortest_cycle_length(self):
+        "shortest cycle of a triangle with a pendant vertex"
+        g = Graph(
+            "g",
+            data={},
+            nodes=set([self.a, self.b, self.e, self.f]),
+            edges=set([self.ae, self.af, self.ef, self.ab]),
+        )
+        self.assertEqual(BaseGraphNumericAnalyzer.shortest_cycle_length(g), 3)
+        self.assertEqual(
+            BaseGraphNumericAnalyzer.shortest_cycle_length(self.ugraph3), 0
+        )
+
 
 def suite():
     """"""
@@ -204,8 +204,8 @@ class BaseGraphAnalyzerTest(unittest.TestCase):
         self.ugraph4 = BaseGraph(
             "ug4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.ugraph2.V).union(self.graph_2.V),
-            edges=set(self.ugraph2.E).union(self.graph_2.E),
+            nodes=self.ugraph2.V | self.graph_2.V,
+            edges=self.ugraph2.E | self.graph_2.E,
         )
         # ugraph 4
         #   +-----+     n1 -- n2 -- n3 -- n4
@@ -336,21 +336,47 @@ class BaseGraphAnalyzerTest(unittest.TestCase):
         self.assertEqual(
             mat,
             {
-                ("a", "b"): True,
+                ("a", "b"): False,
                 ("a", "e"): True,
                 ("a", "f"): True,
                 ("b", "a"): False,
                 ("b", "e"): False,
                 ("b", "f"): False,
                 ("e", "a"): True,
-                ("e", "b"): True,
+                ("e", "b"): False,
                 ("e", "f"): True,
                 ("f", "a"): True,
-                ("f", "b"): True,
+                ("f", "b"): False,
                 ("f", "e"): True,
             },
         )
 
+    def test_transitive_closure_bits(self):
+        """"""
+        index, rows = BaseGraphAnalyzer.transitive_closure_bits(self.ugraph1)
+        aef = 1 << index["a"] | 1 << index["e"] | 1 << index["f"]
+        self.assertEqual(rows[index["a"]], aef)
+        self.assertEqual(rows[index["e"]], aef)
+        self.assertEqual(rows[index["f"]], aef)
+        self.assertEqual(rows[index["b"]], 0)
+
+    def test_transitive_closure_bits_directed(self):
+        """"""
+        a = Node("a", {})
+        b = Node("b", {})
+        c = Node("c", {})
+        d = Node("d", {})
+        ab = Edge.directed("ab", start_node=a, end_node=b)
+        bc = Edge.directed("bc", start_node=b, end_node=c)
+        g = Graph(
+            "g", data={}, nodes=set([a, b, c, d]), edges=set([ab, bc])
+        )
+        index, rows = BaseGraphAnalyzer.transitive_closure_bits(g)
+        self.assertEqual(rows[index["a"]], 1 << index["b"] | 1 << index["c"])
+        self.assertEqual(rows[index["b"]], 1 << index["c"])
+        self.assertEqual(rows[index["c"]], 0)
+        self.assertEqual(rows[index["d"]], 0)
+
     def test_has_self_loop(self):
         """"""
         n1 = Node("n1", {})
@@ -492,9 +518,28 @@ class BaseGraphAnalyzerTest(unittest.TestCase):
     def test_get_component_nodes(self):
         pass
 
-    @unittest.skip("test not implemented")
     def test_get_components_as_node_sets(self):
-        pass
+        """"""
+        comps = BaseGraphNodeAnalyzer.get_components_as_node_sets(
+            self.ugraph5
+        )
+        self.assertEqual(
+            comps,
+            set(
+                [
+                    frozenset([self.a, self.b, self.e, self.f]),
+                    frozenset([self.n1, self.n2, self.n3, self.n4]),
+                ]
+            ),
+        )
+
+    def test_components_dsu(self):
+        """"""
+        comps = BaseGraphNodeAnalyzer.components_dsu(self.ugraph1)
+        self.assertEqual(
+            sorted([sorted(v.id() for v in c) for c in comps]),
+            [["a", "e", "f"], ["b"]],
+        )
 
     @unittest.skip("test not implemented")
     def test_get_component(self):
@@ -144,8 +144,8 @@ class BaseGraphAlgSetOpsTest(unittest.TestCase):
         self.ugraph4 = BaseGraph(
             "ug4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.ugraph2.V).union(self.graph_2.V),
-            edges=set(self.ugraph2.E).union(self.graph_2.E),
+            nodes=self.ugraph2.V | self.graph_2.V,
+            edges=self.ugraph2.E | self.graph_2.E,
         )
         # ugraph 4
         #   +-----+     n1 -- n2 -- n3 -- n4
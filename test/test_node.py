@@ -1,6 +1,7 @@
 """
 Node unit tests
 """
+import sys
 import unittest
 
 from pygmodels.graph.gtype.node import Node
@@ -32,6 +33,13 @@ class NodeTest(unittest.TestCase):
         n1 = Node("mnode", {"my": "data", "is": "awesome"})
         self.assertEqual(hash(n1), hash(mstr))
 
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "abc.ABC has no __slots__ before 3.7"
+    )
+    def test_slots(self):
+        n1 = Node("mnode", {})
+        self.assertFalse(hasattr(n1, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ Test probabilistic graph model
 import cProfile
 import pdb
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 # profiler related
 from pstats import Stats
@@ -14,7 +15,14 @@ from pygmodels.factor.factor import Factor
 from pygmodels.factor.factorf.factoralg import FactorAlgebra
 from pygmodels.factor.factorf.factorops import FactorOps
 from pygmodels.graph.gtype.edge import Edge, EdgeType
-from pygmodels.pgm.pgmtype.pgmodel import PGModel, min_unmarked_neighbours
+from pygmodels.pgm.pgmtype.pgmodel import (
+    PGModel,
+    domain_size,
+    factor_components,
+    factor_index,
+    min_unmarked_fill_edges,
+    min_unmarked_neighbours,
+)
 from pygmodels.pgm.pgmtype.randomvariable import NumCatRVariable
 
 
@@ -312,6 +320,16 @@ class PGModelTest(unittest.TestCase):
             self.pgm.factors(), set([self.ba_f, self.cb_f, self.a_f])
         )
 
+    def test_factors_fn(self):
+        """"""
+        self.assertEqual(
+            self.pgm.factors(f=lambda x: x.id()),
+            set([self.ba_f.id(), self.cb_f.id(), self.a_f.id()]),
+        )
+        fs = self.pgm.factors()
+        fs.clear()
+        self.assertEqual(len(self.pgm.factors()), 3)
+
     def test_closure_of(self):
         """"""
         self.assertEqual(self.pgm.closure_of(self.a), set([self.b, self.a]))
@@ -354,6 +372,18 @@ class PGModelTest(unittest.TestCase):
             set([self.ba_f, self.cb_f, self.a_f]),
         )
 
+    def test_domain_size(self):
+        """"""
+        self.assertEqual(domain_size(self.a_f), 2)
+        self.assertEqual(domain_size(self.ba_f), 4)
+
+    def test_get_factor_product(self):
+        """"""
+        p, v = self.pgm.get_factor_product(set([self.ba_f, self.a_f]))
+        afbf, v2 = FactorAlgebra.product(f=self.a_f, other=self.ba_f)
+        for pr in FactorOps.cartesian(afbf):
+            self.assertAlmostEqual(p.phi(pr), afbf.phi(pr))
+
     def test_get_factor_product_var(self):
         """"""
         p, f, of = self.pgm.get_factor_product_var(
@@ -400,6 +430,82 @@ class PGModelTest(unittest.TestCase):
             elif set([("c", False)]).issubset(sps):
                 self.assertEqual(res, 0.624)
 
+    def test_sum_product_elimination_executor(self):
+        """"""
+        d = NumCatRVariable(
+            node_id="d",
+            input_data={"outcome-values": [True, False]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        d_f = Factor(
+            gid="d_f",
+            scope_vars=set([d]),
+            factor_fn=lambda s: 0.7 if ("d", True) in s else 0.3,
+        )
+        factors = set([self.ba_f, self.cb_f, self.a_f, d_f])
+        expected = self.pgm.sum_product_elimination(
+            factors=factors, Zs=[self.a, self.b, d]
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            p = self.pgm.sum_product_elimination(
+                factors=factors, Zs=[self.a, self.b, d], executor=executor
+            )
+        self.assertEqual(set([s.id() for s in p.scope_vars()]), set(["c"]))
+        for sp in FactorOps.cartesian(p):
+            self.assertEqual(
+                round(p.phi(set(sp)), 6), round(expected.phi(set(sp)), 6)
+            )
+
+    def test_factor_components(self):
+        """"""
+        d = NumCatRVariable(
+            node_id="d",
+            input_data={"outcome-values": [True, False]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        d_f = Factor(gid="d_f", scope_vars=set([d]))
+        components = factor_components(
+            set([self.ba_f, self.cb_f, self.a_f, d_f])
+        )
+        self.assertEqual(len(components), 2)
+        self.assertIn(set([self.ba_f, self.cb_f, self.a_f]), components)
+        self.assertIn(set([d_f]), components)
+
+    def test_min_unmarked_neighbours(self):
+        """"""
+        nodes = set([self.a, self.b, self.c])
+        marked = {"a": False, "b": False, "c": True}
+        X = min_unmarked_neighbours(g=self.pgm, nodes=nodes, marked=marked)
+        self.assertEqual(X, self.a)
+        marked["a"] = True
+        marked["b"] = True
+        X = min_unmarked_neighbours(g=self.pgm, nodes=nodes, marked=marked)
+        self.assertIsNone(X)
+
+    def test_traceback_map(self):
+        """"""
+        assignments = self.pgm.traceback_map(
+            potentials=[self.ba_f, self.cb_f], X_is=[self.a, self.c]
+        )
+        self.assertEqual(assignments, {"a": True, "c": False})
+
+    def test_factor_index(self):
+        """"""
+        index = factor_index(set([self.ba_f, self.cb_f, self.a_f]))
+        self.assertEqual(index["a"], set([self.ba_f, self.a_f]))
+        self.assertEqual(index["b"], set([self.ba_f, self.cb_f]))
+        self.assertEqual(index["c"], set([self.cb_f]))
+
+    def test_order_by_max_cardinality(self):
+        """"""
+        cardinality = self.pgm.order_by_max_cardinality(
+            set([self.a, self.b, self.c])
+        )
+        self.assertEqual(sorted(cardinality.values()), [0, 1, 2])
+        ordering = sorted(cardinality, key=cardinality.get)
+        # on the path a - b - c, b is selected first or second
+        self.assertIn("b", ordering[1:])
+
     def test_order_by_greedy_metric(self):
         """!"""
         ns = set([self.a, self.b])
@@ -420,6 +526,32 @@ class PGModelTest(unittest.TestCase):
             cards3 == {"a": 0, "c": 1} or cards3 == {"a": 1, "c": 0}
         )
 
+    def test_elimination_sequence_by_greedy_metric(self):
+        """!"""
+        ordering = self.pgm.elimination_sequence_by_greedy_metric(
+            nodes=set([self.a, self.b]), s=min_unmarked_neighbours
+        )
+        self.assertEqual(ordering, [self.a, self.b])
+
+    def test_V_by_id(self):
+        """!"""
+        self.assertEqual(
+            self.pgm.V_by_id, {"a": self.a, "b": self.b, "c": self.c}
+        )
+
+    def test_order_by_greedy_metric_min_fill(self):
+        """!"""
+        ns = set([self.a, self.b])
+        cards = self.pgm.order_by_greedy_metric(
+            nodes=ns, s=min_unmarked_fill_edges
+        )
+        self.assertEqual(cards, {"a": 0, "b": 1})
+        ns = set([self.c, self.b])
+        cards2 = self.pgm.order_by_greedy_metric(
+            nodes=ns, s=min_unmarked_fill_edges
+        )
+        self.assertEqual(cards2, {"c": 0, "b": 1})
+
     def test_reduce_factors_with_evidence(self):
         """"""
         ev = set([("a", True), ("b", True)])
@@ -462,6 +594,41 @@ class PGModelTest(unittest.TestCase):
             ),
         )
 
+    def test_reduce_factors_with_evidence_keeps_unrelated(self):
+        """"""
+        fs, es = self.pgm.reduce_factors_with_evidence(set([("a", True)]))
+        self.assertEqual(set([e.id() for e in es]), set(["a"]))
+        self.assertIn(self.cb_f, fs)
+        self.assertNotIn(self.ba_f, fs)
+
+    def test_reduce_factors_with_evidence_mutated_variable(self):
+        """"""
+        a = NumCatRVariable(
+            node_id="a",
+            input_data={"outcome-values": [True, False]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        b = NumCatRVariable(
+            node_id="b",
+            input_data={"outcome-values": [True, False]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        ab = Edge(
+            edge_id="ab",
+            edge_type=EdgeType.UNDIRECTED,
+            start_node=a,
+            end_node=b,
+        )
+        ab_f = Factor(gid="ab_f", scope_vars=set([a, b]))
+        pgm = PGModel(
+            gid="pgm", nodes=set([a, b]), edges=set([ab]), factors=set([ab_f])
+        )
+        a.update_data({"evidence": True})
+        fs, es = pgm.reduce_factors_with_evidence(set([("a", True)]))
+        (f,) = fs
+        sizes = sorted([len(s.values()) for s in f.scope_vars()])
+        self.assertEqual(sizes, [1, 2])
+
     def test_cond_prod_by_variable_elimination(self):
         """!
         Test based on the computation in Darwiche 2009, p. 140
@@ -92,6 +92,25 @@ class NumCatRVariableTest(unittest.TestCase):
     def test_values(self):
         self.assertEqual(self.rvar.values(), frozenset(["A", "F"]))
 
+    def test_values_identity(self):
+        """"""
+        students = PossibleOutcomes(frozenset(["student_1", "student_2"]))
+        rvar = CatRandomVariable(
+            input_data={"possible-outcomes": students}, node_id="students"
+        )
+        self.assertEqual(rvar.values(), students.data)
+
+    def test_has_negative_value(self):
+        self.assertFalse(self.dice.has_negative_value())
+        neg = NumCatRVariable(
+            node_id="neg",
+            input_data={"outcome-values": [-1, 1]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        self.assertTrue(neg.has_negative_value())
+        neg.reduce_to_value(1)
+        self.assertFalse(neg.has_negative_value())
+
     def test_value_set(self):
         self.assertEqual(
             self.rvar.value_set(
@@ -101,6 +120,20 @@ class NumCatRVariableTest(unittest.TestCase):
             frozenset([("myrandomvar", "f")]),
         )
 
+    def test_value_set_filter(self):
+        self.assertEqual(
+            self.rvar.value_set(value_filter=lambda x: x != "A"),
+            frozenset([("myrandomvar", "F")]),
+        )
+
+    def test_value_set_cached(self):
+        vs = self.dice.value_set()
+        self.assertIs(self.dice.value_set(), vs)
+        self.dice.reduce_to_value(2)
+        self.assertEqual(
+            self.dice.value_set(), frozenset([(self.dice.id(), 2)])
+        )
+
     def test_max_marginal_value(self):
         self.assertEqual(self.intelligence.max_marginal_value(), 0.1)
 
@@ -117,6 +150,12 @@ class NumCatRVariableTest(unittest.TestCase):
         """"""
         self.assertEqual(self.dice.expected_value(), 3.5)
 
+    def test_expected_value_reduced(self):
+        """"""
+        self.assertEqual(self.dice.expected_value(), 3.5)
+        self.dice.reduce_to_value(2)
+        self.assertEqual(self.dice.expected_value(), 2 * self.dice.p(2))
+
     def test_marginal_with_known_value(self):
         """"""
         self.assertEqual(self.grade.marginal(0.4), 0.37)
@@ -125,6 +164,29 @@ class NumCatRVariableTest(unittest.TestCase):
         """"""
         self.assertEqual(self.grade.p(0.4), 0.37)
 
+    def test_p_unhashable(self):
+        """"""
+        rv = CatRandomVariable(
+            node_id="rv",
+            input_data={"outcome-values": [1, 2]},
+            marginal_distribution=lambda x: 0.5,
+        )
+        self.assertEqual(rv.p([1, 2]), 0.5)
+        self.assertEqual(rv.p_many([1, [1, 2]]), (0.5, 0.5))
+
+    def test_p_many(self):
+        """"""
+        self.assertEqual(
+            self.grade.p_many([0.4, 0.2]),
+            (self.grade.p(0.4), self.grade.p(0.2)),
+        )
+
+    def test_outcome_table(self):
+        """"""
+        xs, ps = self.dice.outcome_table()
+        self.assertEqual(set(xs), set(self.dice.values()))
+        self.assertEqual(ps, self.dice.p_many(xs))
+
     def test_P_X_e(self):
         """"""
         self.assertEqual(self.grade.P_X_e(), 0.25)
@@ -153,6 +215,65 @@ class NumCatRVariableTest(unittest.TestCase):
         dice.pop_evidence()
         self.assertEqual(dice.joint(dice), 3.5 * 3.5)
 
+    def test_conditional(self):
+        """"""
+        self.assertEqual(
+            self.grade.conditional(self.intelligence), self.grade.P_X_e()
+        )
+
+    def test_max_conditional(self):
+        """"""
+        joint = self.grade.max_joint(self.intelligence)
+        expected = max(
+            [joint / self.intelligence.p(v) for v in [0.1, 0.9]]
+        )
+        self.assertEqual(
+            self.grade.max_conditional(self.intelligence), expected
+        )
+
+    def test_type_check(self):
+        """"""
+        with self.assertRaisesRegex(TypeError, "it is str"):
+            NumCatRVariable.type_check("dice")
+
+    def test_max_marginal_e_reduced(self):
+        """"""
+        self.grade.pop_evidence()
+        self.assertEqual(self.grade.max_marginal_e(), 0.38)
+        self.grade.reduce_to_value(0.2)
+        self.assertEqual(self.grade.max_marginal_e(), 0.25)
+
+    def test_joint_matrix_with_index(self):
+        """"""
+        xs, ys, m = self.grade.joint_matrix_with_index(self.intelligence)
+        for i, x in enumerate(xs):
+            for j, y in enumerate(ys):
+                self.assertEqual(
+                    m[i][j], self.grade.p(x) * self.intelligence.p(y)
+                )
+
+    def test_p_x_fn(self):
+        """"""
+        self.assertEqual(
+            round(self.dice.p_x_fn(lambda x: x * x), 4),
+            round(sum(i * i / 6.0 for i in range(1, 7)), 4),
+        )
+
+    def test_apply_to_marginals(self):
+        """"""
+        self.assertEqual(
+            sorted(self.grade.apply_to_marginals(lambda x: x * 2)),
+            [0.5, 0.74, 0.76],
+        )
+
+    def test_summary(self):
+        """"""
+        summary = self.intelligence.summary()
+        self.assertEqual(summary["E"], self.intelligence.expected_value())
+        self.assertEqual(summary["Var"], self.intelligence.variance())
+        self.assertEqual((summary["max_p"], summary["argmax"]), (0.7, 0.1))
+        self.assertEqual((summary["min_p"], summary["argmin"]), (0.3, 0.9))
+
     def test_variance(self):
         self.assertEqual(round(self.dice.variance(), 3), 2.917)
 
@@ -223,8 +223,8 @@ class UndiGraphTest(unittest.TestCase):
         self.ugraph4 = UndiGraph(
             "ug4",
             data={"my": "graph", "data": "is", "very": "awesome"},
-            nodes=set(self.ugraph2.V).union(self.graph_2.V),
-            edges=set(self.ugraph2.E).union(self.graph_2.E),
+            nodes=self.ugraph2.V | self.graph_2.V,
+            edges=self.ugraph2.E | self.graph_2.E,
         )
         # ugraph 4
         #   +-----+     n1 -- n2 -- n3 -- n4
@@ -325,6 +325,11 @@ class UndiGraphTest(unittest.TestCase):
         nps = [x[0] for x in lpath]
         self.assertEqual(nps, ["n1", "n2", "n3", "n4"])
 
+    def test_check_for_path(self):
+        """"""
+        self.assertTrue(self.ugraph1.check_for_path(self.a, self.f))
+        self.assertFalse(self.ugraph1.check_for_path(self.a, self.b))
+
     def test_lower_bound_for_path_length(self):
         mdegre = self.ugraph1.lower_bound_for_path_length()
         self.assertEqual(mdegre, 0)